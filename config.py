@@ -247,7 +247,7 @@ DOI_INPUT_SETTINGS = {
 # Citation generation settings
 CITATION_SETTINGS = {
     "generate_all_formats": True,
-    "parallel_generation": False,
+    "parallel_generation": True,
     "cache_citations": True,
     "retry_failed": True,
     "max_retries": 3,
@@ -0,0 +1,157 @@
+"""
+Conversion Cache for DOI Citation Manager
+- 변환된 DOI 결과(메타데이터 + 모든 인용 형식)를 디스크에 보관
+- 같은 DOI를 다시 변환할 때 네트워크 요청 없이 반환
+"""
+
+import atexit
+import copy
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from config import APP_SETTINGS, CACHE_FILE
+
+# 사용자별 필드는 캐시하지 않음 (반환할 때 새로 채움)
+USER_FIELDS = ("added_date", "tags", "notes")
+
+# 일시적인 실패로 만들어진 인용문은 캐시하지 않음
+TRANSIENT_ERROR_PREFIXES = ("Error:", "Connection error", "Service error")
+
+
+class ConversionCache:
+    """JSON-file cache of converted papers keyed by normalized DOI"""
+
+    def __init__(self, cache_file=CACHE_FILE):
+        self.cache_file = cache_file
+        self.expiry = timedelta(days=APP_SETTINGS["cache_expiry_days"])
+        self.entries = None  # 처음 사용할 때 로드
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(doi):
+        """Normalize DOI for use as a cache key"""
+        return doi.strip().lower()
+
+    def load(self):
+        """Load cache entries from disk once"""
+        if self.entries is not None:
+            return
+
+        self.entries = {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.entries = data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Could not load conversion cache: {e}")
+
+    def get(self, doi):
+        """Return a fresh copy of the cached paper for doi, or None"""
+        key = self.make_key(doi)
+        with self._lock:
+            self.load()
+            entry = self.entries.get(key)
+            if entry is not None and self.is_expired(entry):
+                del self.entries[key]
+                self.dirty = True
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            paper_data = copy.deepcopy(entry["paper"])
+
+        paper_data["added_date"] = datetime.now().isoformat()
+        paper_data["tags"] = []
+        paper_data["notes"] = ""
+        return paper_data
+
+    def put(self, doi, paper_data):
+        """Store a converted paper unless some citation failed transiently"""
+        citations = paper_data.get("citations", {})
+        if any(
+            isinstance(text, str) and text.startswith(TRANSIENT_ERROR_PREFIXES)
+            for text in citations.values()
+        ):
+            return
+
+        paper = {
+            key: copy.deepcopy(value)
+            for key, value in paper_data.items()
+            if key not in USER_FIELDS
+        }
+        with self._lock:
+            self.load()
+            self.entries[self.make_key(doi)] = {
+                "cached_at": datetime.now().isoformat(),
+                "paper": paper,
+            }
+            self.dirty = True
+
+    def is_expired(self, entry):
+        """Check whether an entry is older than the configured expiry"""
+        try:
+            cached_at = datetime.fromisoformat(entry["cached_at"])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.now() - cached_at > self.expiry
+
+    def save(self):
+        """Write the cache to disk if it changed"""
+        with self._lock:
+            if not self.dirty or self.entries is None:
+                return
+            entries = dict(self.entries)
+            self.dirty = False
+
+        try:
+            # 임시 파일에 쓴 뒤 교체해 중간에 종료되어도 캐시가 깨지지 않게 함
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+        except Exception as e:
+            print(f"Warning: Could not save conversion cache: {e}")
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            self.entries = {}
+            self.dirty = True
+
+    def stats(self):
+        """Return cache size and hit/miss counters"""
+        with self._lock:
+            return {
+                "entries": len(self.entries) if self.entries is not None else 0,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_conversion_cache = None
+_conversion_cache_lock = threading.Lock()
+
+
+def get_conversion_cache():
+    """Return the shared cache, or None when caching is disabled"""
+    global _conversion_cache
+
+    if not APP_SETTINGS["cache_enabled"]:
+        return None
+
+    with _conversion_cache_lock:
+        if _conversion_cache is None:
+            _conversion_cache = ConversionCache()
+            # 종료할 때 한 번만 디스크에 기록
+            atexit.register(_conversion_cache.save)
+        return _conversion_cache
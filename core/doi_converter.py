@@ -6,18 +6,23 @@ DOI Converter - Core logic for DOI to citation conversion
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import re
 import html
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from config import (
     DOI_API_BASE,
     CROSSREF_API_BASE,
     CITATION_FORMATS,
+    CITATION_SETTINGS,
+    NETWORK_SETTINGS,
     REQUEST_TIMEOUT,
     USER_AGENT,
     DOI_PATTERN,
 )
+from core.conversion_cache import get_conversion_cache
 
 
 class DOIConverter:
@@ -27,6 +32,14 @@ class DOIConverter:
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": USER_AGENT})
 
+        # 하나의 converter를 여러 스레드가 함께 쓰므로 동시에 보내는 요청 수
+        # (일괄 변환 작업 수 × 형식별 요청 수)만큼 연결을 유지
+        pool_size = NETWORK_SETTINGS["max_connections"] ** 2
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.cache = get_conversion_cache()
+
     def convert_doi(self, doi):
         """
         Convert DOI to all citation formats
@@ -40,18 +53,23 @@ class DOIConverter:
         # Clean DOI
         doi = self.clean_doi(doi)
 
+        # 이미 변환한 DOI는 캐시에서 반환
+        if self.cache is not None:
+            cached = self.cache.get(doi)
+            if cached is not None:
+                return cached
+
         # Get basic metadata first
-        metadata = self.get_doi_metadata(doi)
+        try:
+            metadata = self.get_crossref_metadata(doi)
+            cacheable = True
+        except requests.exceptions.RequestException:
+            # 대체 경로의 메타데이터는 reference 정보가 없으므로 캐시하지 않음
+            metadata = self.get_doi_metadata_fallback(doi)
+            cacheable = False
 
         # Generate citations in ALL formats automatically
-        citations = {}
-        for fmt_key, fmt_info in CITATION_FORMATS.items():
-            try:
-                citation = self.get_formatted_citation(doi, fmt_key)
-                citations[fmt_key] = citation
-            except Exception as e:
-                print(f"Warning: Failed to get {fmt_key} citation: {e}")
-                citations[fmt_key] = f"Error: {str(e)}"
+        citations = self.generate_citations(doi)
 
         # Combine metadata and citations
         paper_data = {
@@ -62,8 +80,37 @@ class DOIConverter:
             "notes": "",
         }
 
+        if self.cache is not None and cacheable:
+            self.cache.put(doi, paper_data)
+
         return paper_data
 
+    def generate_citations(self, doi):
+        """Fetch citations in every format, concurrently when enabled"""
+        format_keys = list(CITATION_FORMATS)
+
+        if CITATION_SETTINGS["parallel_generation"]:
+            # 형식별 요청은 서로 독립적이므로 동시에 보냄 (연결 수는 설정값으로 제한)
+            max_workers = NETWORK_SETTINGS["max_connections"]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                texts = executor.map(
+                    lambda fmt_key: self.get_citation_or_error(doi, fmt_key),
+                    format_keys,
+                )
+                return dict(zip(format_keys, texts))
+
+        return {
+            fmt_key: self.get_citation_or_error(doi, fmt_key) for fmt_key in format_keys
+        }
+
+    def get_citation_or_error(self, doi, fmt_key):
+        """Get one formatted citation, or an error string if it fails"""
+        try:
+            return self.get_formatted_citation(doi, fmt_key)
+        except Exception as e:
+            print(f"Warning: Failed to get {fmt_key} citation: {e}")
+            return f"Error: {str(e)}"
+
     def clean_doi(self, doi):
         """Clean and validate DOI string"""
         if not doi:
@@ -111,23 +158,26 @@ class DOIConverter:
         """Get basic metadata for DOI using CrossRef API"""
         try:
             # Try CrossRef REST API first
-            url = f"{CROSSREF_API_BASE}{doi}"
-            headers = {"Accept": "application/json"}
-
-            response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-
-            data = response.json()
-            work = data["message"]
-
-            # Extract and normalize metadata
-            metadata = self.normalize_crossref_metadata(work)
-            return metadata
+            return self.get_crossref_metadata(doi)
 
         except requests.exceptions.RequestException as e:
             # Fallback to DOI content negotiation
             return self.get_doi_metadata_fallback(doi)
 
+    def get_crossref_metadata(self, doi):
+        """Get metadata from the CrossRef REST API (raises on request errors)"""
+        url = f"{CROSSREF_API_BASE}{doi}"
+        headers = {"Accept": "application/json"}
+
+        response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+        data = response.json()
+        work = data["message"]
+
+        # Extract and normalize metadata
+        return self.normalize_crossref_metadata(work)
+
     def normalize_crossref_metadata(self, work):
         """Normalize CrossRef metadata to standard format"""
         # Extract title
@@ -41,6 +41,10 @@ class PaperManager:
         """Add paper to specific project"""
         return self.storage.add_paper_to_project(project_id, paper_data)
 
+    def add_papers_to_project(self, project_id, papers_data):
+        """Add several papers to a project with a single save"""
+        return self.storage.add_papers_to_project(project_id, papers_data)
+
     def remove_paper_from_project(self, project_id, paper_id):
         """Remove paper from project"""
         return self.storage.remove_paper_from_project(project_id, paper_id)
@@ -428,6 +428,34 @@ class Storage:
             
         return paper
         
+    def add_papers_to_project(self, project_id, papers_data):
+        """Add several papers to a project and save once"""
+        project = self.get_project_by_id(project_id)
+        if not project:
+            return []
+            
+        if 'papers' not in project:
+            project['papers'] = []
+        project_paper_ids = set(project['papers'])
+        
+        added = []
+        for paper_data in papers_data:
+            paper_id = paper_data.get('id') or self.generate_id()
+            paper_data['id'] = paper_id
+            paper_data['added'] = datetime.now().isoformat()
+            self.data['papers'][paper_id] = paper_data
+            
+            if paper_id not in project_paper_ids:
+                project_paper_ids.add(paper_id)
+                project['papers'].append(paper_id)
+            added.append(paper_data)
+            
+        if added:
+            project['modified'] = datetime.now().isoformat()
+            self.save_data()
+            logger.info(f"Added {len(added)} papers to project: {project['name']}")
+        return added
+        
     def remove_paper_from_project(self, project_id, paper_id):
         """Remove paper from project (but keep in collection)"""
         project = self.get_project_by_id(project_id)
@@ -5,40 +5,384 @@ Detail Panel Widget for DOI Citation Manager
 - References 탭
 """
 
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+from html import escape
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QTextEdit,
+    QPlainTextEdit,
     QPushButton,
     QScrollArea,
     QFrame,
     QLineEdit,
     QComboBox,
     QTabWidget,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMessageBox,
     QApplication,
     QSplitter,
     QGroupBox,
+    QSizePolicy,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOption,
+    QStyleOptionViewItem,
+)
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractListModel,
+    QModelIndex,
+    QPointF,
+    QRunnable,
+    QSignalBlocker,
+    QSize,
+    QThreadPool,
+    QTimer,
+)
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QIcon,
+    QStaticText,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QPixmap, QIcon
 
 from config import CITATION_FORMATS
 
+# 인용 형식 그룹 (모듈 로드 시 한 번만 계산)
+ACADEMIC_FORMATS = [
+    "APA",
+    "IEEE",
+    "Nature",
+    "Science",
+    "Cell",
+    "PNAS",
+    "PLoS",
+    "Vancouver",
+]
+STANDARD_FORMATS = ["MLA", "Chicago", "Harvard"]
+EXPORT_FORMATS = ["BibTeX", "RIS", "JSON"]
+
+_ACADEMIC_KEYS = frozenset(ACADEMIC_FORMATS)
+_EXPORT_KEYS = frozenset(EXPORT_FORMATS)
+
+# (group_name, ordered format keys, format key set)
+CITATION_GROUPS = (
+    ("Academic Journals", ACADEMIC_FORMATS, _ACADEMIC_KEYS),
+    ("Standard Formats", STANDARD_FORMATS, frozenset(STANDARD_FORMATS)),
+    ("Export Formats", EXPORT_FORMATS, _EXPORT_KEYS),
+)
+
+# format_key -> display_name (설정에 없는 형식은 키를 그대로 표시)
+_DISPLAY_BY_KEY = {key: info["display_name"] for key, info in CITATION_FORMATS.items()}
+
+# Format combo entries: (display_name, format_key)
+_COMBO_ITEMS = [(name, key) for key, name in _DISPLAY_BY_KEY.items()]
+
+# 필터 값 -> 표시할 format key 집합 (단일 형식은 filter_citations에서 처리)
+_FILTER_KEYS = {
+    "all": frozenset(key for _, keys, _ in CITATION_GROUPS for key in keys),
+    "academic": _ACADEMIC_KEYS,
+    "export": _EXPORT_KEYS,
+}
+
+# 내용이 많아 선택 직후가 아닌 다음 이벤트 루프에서 채우는 탭
+DEFERRED_TABS = frozenset(("citations", "references"))
+
+# 반복 생성되는 위젯의 스타일은 objectName 선택자로 패널에 한 번만 적용
+DETAIL_PANEL_QSS = """
+QLabel#citationFormat {
+    font-weight: bold;
+    color: #2196F3;
+    font-size: 11px;
+}
+QLabel#citationStructured {
+    padding: 10px;
+    background-color: #f8f8f8;
+    border-radius: 4px;
+    border-left: 3px solid #2196F3;
+    font-family: 'Courier New', monospace;
+}
+QWidget#citationProse {
+    background-color: #f5f5f5;
+    border-radius: 4px;
+    border-left: 3px solid #4CAF50;
+}
+QLabel#citationGroupHeader {
+    font-weight: bold;
+    font-size: 12px;
+    color: #1976D2;
+    margin-top: 15px;
+    margin-bottom: 5px;
+}
+QLabel#emptyMessage {
+    font-style: italic;
+    color: #666;
+    padding: 20px;
+}
+QLabel#tagPill {
+    background-color: #E3F2FD;
+    border-radius: 12px;
+    padding: 4px 8px;
+    font-size: 10px;
+    color: #1976D2;
+    font-weight: bold;
+}
+QLabel#tagPill:hover {
+    background-color: #BBDEFB;
+}
+QListView#paperList::item {
+    border-bottom: 1px solid #eee;
+}
+QListView#paperList::item:selected {
+    background-color: #e3f2fd;
+}
+QListView#paperList::item:hover {
+    background-color: #f0f8ff;
+}
+"""
+
+
+@contextmanager
+def suspended_layout(widget):
+    """Suspend layout and repaint of widget while its children are rebuilt"""
+    layout = widget.layout()
+    widget.setUpdatesEnabled(False)
+    layout.setEnabled(False)
+    try:
+        yield
+    finally:
+        layout.setEnabled(True)
+        layout.invalidate()
+        layout.activate()
+        widget.setUpdatesEnabled(True)
+
+
+# 논문 목록 행의 두 번째 줄(저자) 텍스트용 role
+PAPER_SUBTITLE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class PaperItemDelegate(QStyledItemDelegate):
+    """Delegate that paints paper rows from cached, elided QStaticText"""
+
+    PADDING = 8
+    MAX_CACHE_SIZE = 4096
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._static_text_cache = {}
+
+    def get_static_texts(self, title, subtitle, font, width):
+        """Return cached (title, subtitle) QStaticText elided to width"""
+        key = (title, subtitle, font.key(), width)
+        cached = self._static_text_cache.get(key)
+        if cached is None:
+            if len(self._static_text_cache) >= self.MAX_CACHE_SIZE:
+                self._static_text_cache.clear()
+
+            metrics = QFontMetrics(font)
+            elide = Qt.TextElideMode.ElideRight
+            cached = (
+                QStaticText(metrics.elidedText(title, elide, width)),
+                QStaticText(metrics.elidedText(subtitle, elide, width)),
+            )
+            for static_text in cached:
+                static_text.setTextFormat(Qt.TextFormat.PlainText)
+                static_text.prepare(font=font)
+            self._static_text_cache[key] = cached
+        return cached
+
+    def paint(self, painter, option, index):
+        """Paint item background and cached text lines"""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget
+        )
+
+        rect = option.rect.adjusted(
+            self.PADDING, self.PADDING // 2, -self.PADDING, -self.PADDING // 2
+        )
+        title = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        subtitle = index.data(PAPER_SUBTITLE_ROLE) or ""
+        title_text, subtitle_text = self.get_static_texts(
+            title, subtitle, option.font, rect.width()
+        )
+
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        role = (
+            QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        )
+
+        painter.save()
+        painter.setFont(option.font)
+        painter.setPen(option.palette.color(role))
+        line_height = QFontMetrics(option.font).lineSpacing()
+        painter.drawStaticText(QPointF(rect.topLeft()), title_text)
+        painter.drawStaticText(
+            QPointF(rect.left(), rect.top() + line_height), subtitle_text
+        )
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        """Two text lines plus padding"""
+        line_height = QFontMetrics(option.font).lineSpacing()
+        return QSize(option.rect.width(), line_height * 2 + self.PADDING * 2)
+
+
+def first_author_name(paper):
+    """Return the first author's display name"""
+    authors = paper.get("authors")
+    if not isinstance(authors, list) or not authors:
+        return "Unknown Author"
+
+    first_author = authors[0]
+    if isinstance(first_author, dict):
+        get = first_author.get
+        name = f"{get('given', '')} {get('family', '')}".strip()
+        return name or "Unknown Author"
+    return str(first_author) if first_author else "Unknown Author"
+
+
+class PaperListModel(QAbstractListModel):
+    """List model over paper dicts for project and search listings"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._papers = []
+        self._rows = []
+        self._year_of = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._papers)
+
+    def row_texts(self, row):
+        """Return (title, author) for row, built on first use"""
+        texts = self._rows[row]
+        if texts is None:
+            paper = self._papers[row]
+            title = paper.get("title", "Unknown Title")
+            if self._year_of is not None:
+                # Add publication year if available
+                year = self._year_of(paper)
+                if year:
+                    title = f"{title} ({year})"
+            texts = (title, first_author_name(paper))
+            self._rows[row] = texts
+        return texts
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.row_texts(index.row())[0]
+        if role == PAPER_SUBTITLE_ROLE:
+            return self.row_texts(index.row())[1]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._papers[index.row()]
+        return None
+
+    def set_papers(self, papers, year_of=None):
+        """Replace all papers; year_of(paper) adds a year suffix to titles"""
+        self.beginResetModel()
+        self._papers = list(papers)
+        self._rows = [None] * len(self._papers)
+        self._year_of = year_of
+        self.endResetModel()
+
+
+class StaticCitationLabel(QWidget):
+    """Lightweight word-wrapped text widget painted from a cached QStaticText"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._static = QStaticText()
+        self._static.setTextFormat(Qt.TextFormat.PlainText)
+        self._text_width = -1
+
+        size_policy = QSizePolicy(
+            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
+        )
+        size_policy.setHeightForWidth(True)
+        self.setSizePolicy(size_policy)
+        self.setContentsMargins(10, 10, 10, 10)
+
+    def text(self):
+        """Return displayed text"""
+        return self._static.text()
+
+    def setText(self, text):
+        """Replace displayed text"""
+        self._static.setText(text)
+        self._text_width = -1
+        self.updateGeometry()
+        self.update()
+
+    def _layout_text(self, text_width):
+        """Wrap static text to width (layout is cached by QStaticText)"""
+        text_width = max(text_width, 1)
+        if text_width != self._text_width:
+            self._static.setTextWidth(text_width)
+            self._static.prepare(font=self.font())
+            self._text_width = text_width
+
+    def hasHeightForWidth(self):
+        return True
+
+    def heightForWidth(self, width):
+        margins = self.contentsMargins()
+        self._layout_text(width - margins.left() - margins.right())
+        return int(self._static.size().height()) + margins.top() + margins.bottom()
+
+    def sizeHint(self):
+        width = max(self.width(), 200)
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self):
+        return QSize(0, 0)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+
+        # 스타일시트 배경/테두리 그리기
+        opt = QStyleOption()
+        opt.initFrom(self)
+        self.style().drawPrimitive(
+            QStyle.PrimitiveElement.PE_Widget, opt, painter, self
+        )
+
+        rect = self.contentsRect()
+        self._layout_text(rect.width())
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        painter.drawStaticText(QPointF(rect.topLeft()), self._static)
+
 
 class CitationDisplay(QFrame):
     """Widget for displaying citation in different formats)"""
 
-    copy_requested = pyqtSignal(str)
+    # 모든 인스턴스가 공유 (QApplication 생성 후 처음 쓸 때 만듦)
+    _mono_font = None
 
     def __init__(self, format_name, citation_text):
         super().__init__()
         self.format_name = format_name
         self.citation_text = citation_text
+        self._bound_citation = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -52,119 +396,269 @@ class CitationDisplay(QFrame):
         # Header with format name and copy button
         header_layout = QHBoxLayout()
 
-        format_label = QLabel(self.format_name)
-        format_label.setStyleSheet(
-            "font-weight: bold; color: #2196F3; font-size: 11px;"
-        )
-        header_layout.addWidget(format_label)
+        self.format_label = QLabel()
+        self.format_label.setObjectName("citationFormat")
+        header_layout.addWidget(self.format_label)
 
         header_layout.addStretch()
 
-        copy_btn = QPushButton("📋 Copy")
-        copy_btn.setToolTip(f"Copy {self.format_name} citation to clipboard")
-        copy_btn.setMaximumWidth(70)
-        copy_btn.clicked.connect(self.copy_citation)
-        header_layout.addWidget(copy_btn)
+        # 복사 버튼은 동적 속성만 가지고, 클릭 처리는 DetailPanelWidget에서 일괄 연결
+        self.copy_btn = QPushButton("📋 Copy")
+        self.copy_btn.setMaximumWidth(70)
+        header_layout.addWidget(self.copy_btn)
 
         layout.addLayout(header_layout)
 
-        # Citation text with better styling
-        citation_label = QLabel(self.citation_text)
-        citation_label.setWordWrap(True)
-        citation_label.setTextInteractionFlags(
+        # Structured citation text (BibTeX, RIS, JSON) - selectable monospace
+        self.citation_label = QLabel()
+        self.citation_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.citation_label.setWordWrap(True)
+        self.citation_label.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse
         )
+        self.citation_label.setFont(self.mono_font())
+        self.citation_label.setObjectName("citationStructured")
+        layout.addWidget(self.citation_label)
+
+        # Prose citation text - drawn from cached QStaticText layout
+        self.static_label = StaticCitationLabel()
+        self.static_label.setObjectName("citationProse")
+        layout.addWidget(self.static_label)
+
+        self.set_citation(self.format_name, self.citation_text)
+
+    @classmethod
+    def mono_font(cls):
+        """Shared monospace font for structured citation text"""
+        if cls._mono_font is None:
+            cls._mono_font = QFont("Courier New", 9)
+        return cls._mono_font
+
+    def set_citation(self, format_name, citation_text):
+        """Rebind widget to another citation without rebuilding it"""
+        # 같은 인용문이면 텍스트 재설정 생략
+        if self._bound_citation == (format_name, citation_text):
+            return
+        self._bound_citation = (format_name, citation_text)
 
-        # 인용문 타입에 따른 스타일링
+        self.format_name = format_name
+        self.citation_text = citation_text
+
+        self.format_label.setText(format_name)
+        self.copy_btn.setToolTip(f"Copy {format_name} citation to clipboard")
+        self.copy_btn.setProperty("citation_text", citation_text)
+        self.copy_btn.setProperty("format_name", format_name)
+
+        # 인용문 타입에 따라 표시 위젯 전환
         if self.is_structured_format():
-            font = QFont("Courier New", 9)  # Monospace for BibTeX, RIS
-            citation_label.setFont(font)
-            citation_label.setStyleSheet(
-                "padding: 10px; background-color: #f8f8f8; border-radius: 4px; "
-                "border-left: 3px solid #2196F3; font-family: 'Courier New', monospace;"
-            )
+            self.citation_label.setText(citation_text)
+            self.static_label.hide()
+            self.citation_label.show()
         else:
-            citation_label.setStyleSheet(
-                "padding: 10px; background-color: #f5f5f5; border-radius: 4px; "
-                "line-height: 1.4; border-left: 3px solid #4CAF50;"
-            )
-
-        layout.addWidget(citation_label)
+            self.static_label.setText(citation_text)
+            self.citation_label.hide()
+            self.static_label.show()
 
     def is_structured_format(self):
         """Check if format is structured (BibTeX, RIS, JSON)"""
         return self.format_name in ["BibTeX", "RIS (EndNote/Mendeley)", "CSL-JSON"]
 
-    def copy_citation(self):
-        """Copy citation to clipboard"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.citation_text)
-        self.copy_requested.emit(f"Copied {self.format_name} citation to clipboard")
 
+def format_reference_text(reference_data):
+    """Build display text for a single reference"""
+    # 캐시 키로 쓸 수 있도록 문자열 값만 넘김 (없는 필드는 None)
+    text = reference_data.get("text")
+    author = reference_data.get("author")
+    year = reference_data.get("year")
+    journal = reference_data.get("journal")
+    return _build_ref_text(
+        text,
+        None if author is None else str(author),
+        None if year is None else str(year),
+        None if journal is None else str(journal),
+    )
+
+
+# CrossRef 레퍼런스 텍스트의 줄바꿈/연속 공백 정리용
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def _build_ref_text(text, author, year, journal):
+    """Truncate or assemble reference text from primitive fields"""
+    if text is not None:
+        text = _WS_RE.sub(" ", text).strip()
+        ref_text = text[:200]  # Truncate long references
+        if len(text) > 200:
+            ref_text += "..."
+        return ref_text
+
+    # Construct from available fields
+    parts = []
+    if author is not None:
+        parts.append(author)
+    if year is not None:
+        parts.append(f"({year})")
+    if journal is not None:
+        parts.append(journal)
+    return " ".join(parts) if parts else "Reference information not available"
+
+
+class ReferenceTextPrefetch(QRunnable):
+    """Build reference display texts in a worker thread to warm the cache"""
+
+    def __init__(self, references):
+        super().__init__()
+        self.references = list(references)
 
-class ReferenceItem(QFrame):
-    """Widget for displaying individual reference"""
+    def run(self):
+        for reference_data in self.references:
+            format_reference_text(reference_data)
 
-    def __init__(self, reference_data, ref_number):
-        super().__init__()
-        self.reference_data = reference_data
-        self.ref_number = ref_number
-        self.setup_ui()
 
-    def setup_ui(self):
-        """Setup reference item UI"""
-        self.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.setLineWidth(1)
-        self.setStyleSheet(
-            "QFrame { background-color: #fafafa; border-radius: 4px; margin: 2px; }"
-            "QFrame:hover { background-color: #f0f0f0; }"
-        )
+# 레퍼런스 DOI 텍스트용 role
+REFERENCE_DOI_ROLE = Qt.ItemDataRole.UserRole + 1
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 6, 8, 6)
-        layout.setSpacing(4)
 
-        # Reference number and main info
-        header_layout = QHBoxLayout()
+class ReferenceListModel(QAbstractListModel):
+    """List model over raw CrossRef reference dicts"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._references = []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._references)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
 
-        ref_num_label = QLabel(f"[{self.ref_number}]")
-        ref_num_label.setStyleSheet(
-            "font-weight: bold; color: #1976D2; font-size: 10px; min-width: 30px;"
+        reference_data = self._references[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_reference_text(reference_data)
+        if role == REFERENCE_DOI_ROLE:
+            return reference_data.get("DOI")
+        if role == Qt.ItemDataRole.UserRole:
+            return reference_data
+        return None
+
+    def set_references(self, references):
+        """Replace all references"""
+        self.beginResetModel()
+        self._references = list(references)
+        self.endResetModel()
+
+
+class ReferenceItemDelegate(QStyledItemDelegate):
+    """Delegate painting references from QStaticText cached per (row, width)"""
+
+    PADDING_X = 8
+    PADDING_Y = 6
+    SPACING = 4
+    NUMBER_WIDTH = 36
+    NUMBER_COLOR = QColor("#1976D2")
+    DOI_COLOR = QColor("#2196F3")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._row_cache = {}
+        self._cache_width = None
+        self._number_font = None
+
+    def number_font(self, font):
+        """Bold copy of font for the [n] column, rebuilt only if font changes"""
+        if self._number_font is None or self._number_font[0] != font.key():
+            number_font = QFont(font)
+            number_font.setBold(True)
+            self._number_font = (font.key(), number_font)
+        return self._number_font[1]
+
+    def clear_cache(self):
+        """Drop cached row layouts (call when the model is reset)"""
+        self._row_cache.clear()
+
+    def row_layout(self, index, width, font):
+        """Return cached (number, text, doi, height) layout for a row"""
+        # 폭이 바뀌면 이전 폭의 레이아웃은 더 이상 쓰이지 않음
+        if width != self._cache_width:
+            self._row_cache.clear()
+            self._cache_width = width
+
+        key = (index.row(), width)
+        cached = self._row_cache.get(key)
+        if cached is not None:
+            return cached
+
+        text_width = max(width - 2 * self.PADDING_X - self.NUMBER_WIDTH, 1)
+
+        number = QStaticText(f"[{index.row() + 1}]")
+        number.setTextFormat(Qt.TextFormat.PlainText)
+        number.prepare(font=self.number_font(font))
+
+        text = QStaticText(index.data(Qt.ItemDataRole.DisplayRole) or "")
+        text.setTextFormat(Qt.TextFormat.PlainText)
+        text.setTextWidth(text_width)
+        text.prepare(font=font)
+        height = text.size().height()
+
+        doi = None
+        doi_value = index.data(REFERENCE_DOI_ROLE)
+        if doi_value:
+            doi = QStaticText(f"DOI: {doi_value}")
+            doi.setTextFormat(Qt.TextFormat.PlainText)
+            doi.setTextWidth(text_width)
+            doi.prepare(font=font)
+            height += self.SPACING + doi.size().height()
+
+        cached = (number, text, doi, int(height) + 2 * self.PADDING_Y)
+        self._row_cache[key] = cached
+        return cached
+
+    def view_width(self, option):
+        """Width available to a row"""
+        view = option.widget
+        if view is not None:
+            return view.viewport().width()
+        return option.rect.width()
+
+    def paint(self, painter, option, index):
+        """Paint item background and cached reference text"""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget
         )
-        header_layout.addWidget(ref_num_label)
 
-        # Main reference text
-        if "text" in self.reference_data:
-            ref_text = self.reference_data["text"][:200]  # Truncate long references
-            if len(self.reference_data["text"]) > 200:
-                ref_text += "..."
-        else:
-            # Construct from available fields
-            parts = []
-            if "author" in self.reference_data:
-                parts.append(str(self.reference_data["author"]))
-            if "year" in self.reference_data:
-                parts.append(f"({self.reference_data['year']})")
-            if "journal" in self.reference_data:
-                parts.append(self.reference_data["journal"])
-            ref_text = (
-                " ".join(parts) if parts else "Reference information not available"
-            )
+        width = self.view_width(option)
+        number, text, doi, _ = self.row_layout(index, width, option.font)
+        left = option.rect.left() + self.PADDING_X
+        top = option.rect.top() + self.PADDING_Y
 
-        ref_label = QLabel(ref_text)
-        ref_label.setWordWrap(True)
-        ref_label.setStyleSheet("font-size: 10px; color: #333;")
-        header_layout.addWidget(ref_label, 1)
+        painter.save()
+        painter.setFont(self.number_font(option.font))
+        painter.setPen(self.NUMBER_COLOR)
+        painter.drawStaticText(QPointF(left, top), number)
 
-        layout.addLayout(header_layout)
+        painter.setFont(option.font)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.drawStaticText(QPointF(left + self.NUMBER_WIDTH, top), text)
 
-        # DOI if available
-        if "DOI" in self.reference_data:
-            doi_label = QLabel(f"DOI: {self.reference_data['DOI']}")
-            doi_label.setStyleSheet(
-                "font-size: 9px; color: #2196F3; font-family: monospace;"
-            )
-            layout.addWidget(doi_label)
+        if doi is not None:
+            painter.setPen(self.DOI_COLOR)
+            doi_top = top + text.size().height() + self.SPACING
+            painter.drawStaticText(QPointF(left + self.NUMBER_WIDTH, doi_top), doi)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        """Height of wrapped reference text for the current view width"""
+        width = self.view_width(option)
+        *_, height = self.row_layout(index, width, option.font)
+        return QSize(width, height)
 
 
 class TagWidget(QWidget):
@@ -175,6 +669,7 @@ class TagWidget(QWidget):
     def __init__(self, tags=None):
         super().__init__()
         self.tags = tags or []
+        self._tag_labels = {}
         self.setup_ui()
 
     def setup_ui(self):
@@ -203,6 +698,7 @@ class TagWidget(QWidget):
         self.tags_container = QWidget()
         self.tags_layout = QHBoxLayout(self.tags_container)
         self.tags_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.tags_layout.addStretch()
 
         scroll_area = QScrollArea()
         scroll_area.setWidget(self.tags_container)
@@ -217,46 +713,53 @@ class TagWidget(QWidget):
 
     def refresh_tags(self):
         """Refresh tag display"""
-        # Clear existing tags
-        for i in reversed(range(self.tags_layout.count())):
-            child = self.tags_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
-
-        # Add new tag widgets
-        for tag in self.tags:
-            tag_widget = self.create_tag_widget(tag)
-            self.tags_layout.addWidget(tag_widget)
-
-        self.tags_layout.addStretch()
+        wanted = dict.fromkeys(self.tags)
+
+        # 사라진 태그만 제거
+        for tag in [tag for tag in self._tag_labels if tag not in wanted]:
+            self._remove_tag_widget(tag)
+
+        # 새 태그만 생성하고 순서가 달라진 태그만 옮김 (끝의 stretch는 유지)
+        for index, tag in enumerate(wanted):
+            tag_widget = self._tag_labels.get(tag)
+            if tag_widget is None:
+                self._add_tag_widget(tag, index)
+            elif self.tags_layout.indexOf(tag_widget) != index:
+                self.tags_layout.removeWidget(tag_widget)
+                self.tags_layout.insertWidget(index, tag_widget)
+
+    def _add_tag_widget(self, tag, index=None):
+        """Insert a pill for tag, by default just before the trailing stretch"""
+        if index is None:
+            index = len(self._tag_labels)
+        tag_widget = self.create_tag_widget(tag)
+        self._tag_labels[tag] = tag_widget
+        self.tags_layout.insertWidget(index, tag_widget)
+
+    def _remove_tag_widget(self, tag):
+        """Delete the pill for tag if it is shown"""
+        tag_widget = self._tag_labels.pop(tag, None)
+        if tag_widget is not None:
+            self.tags_layout.removeWidget(tag_widget)
+            tag_widget.deleteLater()
 
     def create_tag_widget(self, tag):
         """Create individual tag widget"""
-        tag_frame = QFrame()
-        tag_frame.setStyleSheet(
-            "QFrame { background-color: #E3F2FD; border-radius: 12px; padding: 2px; }"
-            "QFrame:hover { background-color: #BBDEFB; }"
-        )
-
-        layout = QHBoxLayout(tag_frame)
-        layout.setContentsMargins(8, 4, 8, 4)
-        layout.setSpacing(4)
-
-        tag_label = QLabel(tag)
-        tag_label.setStyleSheet("font-size: 10px; color: #1976D2; font-weight: bold;")
-        layout.addWidget(tag_label)
-
-        remove_btn = QPushButton("×")
-        remove_btn.setFixedSize(16, 16)
-        remove_btn.setStyleSheet(
-            "QPushButton { border: none; font-size: 10px; font-weight: bold; "
-            "color: #666; background-color: transparent; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #f44336; color: white; }"
+        tag_text = escape(tag)
+        tag_label = QLabel(
+            f'{tag_text} <a href="rm:{tag_text}" '
+            f'style="color: #666; text-decoration: none;">×</a>'
         )
-        remove_btn.clicked.connect(lambda: self.remove_tag(tag))
-        layout.addWidget(remove_btn)
+        tag_label.setObjectName("tagPill")
+        tag_label.setTextFormat(Qt.TextFormat.RichText)
+        tag_label.setToolTip(tag)
+        tag_label.linkActivated.connect(self._on_tag_link)
+        return tag_label
 
-        return tag_frame
+    def _on_tag_link(self, link):
+        """Remove the tag whose × link was clicked"""
+        if link.startswith("rm:"):
+            self.remove_tag(link[3:])
 
     def add_tag(self):
         """Add new tag"""
@@ -264,27 +767,81 @@ class TagWidget(QWidget):
         if tag and tag not in self.tags:
             self.tags.append(tag)
             self.tag_input.clear()
-            self.refresh_tags()
+            self._add_tag_widget(tag)
             self.tags_changed.emit(self.tags)
 
     def remove_tag(self, tag):
         """Remove tag"""
         if tag in self.tags:
             self.tags.remove(tag)
-            self.refresh_tags()
+            self._remove_tag_widget(tag)
             self.tags_changed.emit(self.tags)
 
 
+@lru_cache(maxsize=1024)
+def _format_authors(authors):
+    """Join (given, family) pairs, falling back to plain author strings"""
+    authors_text = ", ".join(
+        f"{author[0]} {author[1]}".strip()
+        for author in authors
+        if isinstance(author, tuple)
+    )
+    if not authors_text:
+        authors_text = ", ".join(
+            author for author in authors if not isinstance(author, tuple)
+        )
+    return authors_text
+
+
+@lru_cache(maxsize=1024)
+def _format_journal_line(journal, year, volume, issue, pages):
+    """Build the journal • year • volume • issue • pages line"""
+    journal_parts = (
+        journal,
+        f"({year})" if year else None,
+        f"Vol. {volume}" if volume else None,
+        f"Issue {issue}" if issue else None,
+        f"pp. {pages}" if pages else None,
+    )
+    return " • ".join(p for p in journal_parts if p)
+
+
 class DetailPanelWidget(QWidget):
     """Widget for displaying paper details and citations"""
 
     def __init__(self):
         super().__init__()
         self.current_paper = None
+        self._last_citations_doi = None
+        self._last_ref_key = None
+        self._year_cache = {}
+        self.citations_pool_widget = None
+        self._citation_pool = {}
+        self._group_headers = {}
+        self.paper_delegate = PaperItemDelegate(self)
+        self.paper_model = PaperListModel(self)
+        self.paper_list_view = None
+        self.paper_list_empty_label = None
+
+        # 보이는 탭만 채우고 나머지는 표시될 때까지 미룸
+        self._dirty = dict.fromkeys(
+            ("details", "citations", "references", "abstract", "notes"), False
+        )
+        # 논문을 빠르게 넘길 때 이전 논문의 지연된 작업을 무시하기 위한 토큰
+        self._display_token = 0
+
+        # 노트 입력은 키 입력마다 저장하지 않고 잠시 모아서 반영
+        self._notes_timer = QTimer(self)
+        self._notes_timer.setSingleShot(True)
+        self._notes_timer.setInterval(300)
+        self._notes_timer.timeout.connect(self._flush_notes)
+
         self.setup_ui()
 
     def setup_ui(self):
         """Setup detail panel UI"""
+        self.setStyleSheet(DETAIL_PANEL_QSS)
+
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
 
@@ -335,6 +892,22 @@ class DetailPanelWidget(QWidget):
         self.notes_tab = self.create_notes_tab()
         self.tabs.addTab(self.notes_tab, "💭 Notes")
 
+        self._tab_keys = {
+            self.details_tab: "details",
+            self.citations_tab: "citations",
+            self.references_tab: "references",
+            self.abstract_tab: "abstract",
+            self.notes_tab: "notes",
+        }
+        self._tab_refreshers = {
+            "details": self.display_details,
+            "citations": self.display_citations,
+            "references": self.display_references,
+            "abstract": self.display_abstract,
+            "notes": self.display_notes,
+        }
+        self.tabs.currentChanged.connect(self._refresh_current_tab)
+
     def create_details_tab(self):
         """Create paper details tab"""
         widget = QWidget()
@@ -352,7 +925,9 @@ class DetailPanelWidget(QWidget):
         info_group = QGroupBox("Paper Information")
         info_layout = QVBoxLayout(info_group)
 
+        # 논문 데이터를 표시하는 라벨은 리치 텍스트 판별 없이 일반 텍스트로 처리
         self.title_label = QLabel("No paper selected")
+        self.title_label.setTextFormat(Qt.TextFormat.PlainText)
         self.title_label.setWordWrap(True)
         self.title_label.setStyleSheet(
             "font-weight: bold; font-size: 14px; margin-bottom: 8px; color: #1976D2;"
@@ -360,6 +935,7 @@ class DetailPanelWidget(QWidget):
         info_layout.addWidget(self.title_label)
 
         self.authors_label = QLabel("")
+        self.authors_label.setTextFormat(Qt.TextFormat.PlainText)
         self.authors_label.setWordWrap(True)
         self.authors_label.setStyleSheet(
             "font-size: 11px; color: #555; margin-bottom: 4px;"
@@ -367,11 +943,13 @@ class DetailPanelWidget(QWidget):
         info_layout.addWidget(self.authors_label)
 
         self.journal_label = QLabel("")
+        self.journal_label.setTextFormat(Qt.TextFormat.PlainText)
         self.journal_label.setWordWrap(True)
         self.journal_label.setStyleSheet("font-size: 11px; margin-bottom: 8px;")
         info_layout.addWidget(self.journal_label)
 
         self.doi_label = QLabel("")
+        self.doi_label.setTextFormat(Qt.TextFormat.PlainText)
         self.doi_label.setWordWrap(True)
         self.doi_label.setStyleSheet(
             "font-size: 10px; color: #2196F3; margin-bottom: 12px; font-family: monospace;"
@@ -409,8 +987,8 @@ class DetailPanelWidget(QWidget):
         self.format_combo.addItem("Show All Formats", "all")
         self.format_combo.addItem("Academic Formats Only", "academic")
         self.format_combo.addItem("Export Formats Only", "export")
-        for format_key, format_info in CITATION_FORMATS.items():
-            self.format_combo.addItem(format_info["display_name"], format_key)
+        for display_name, format_key in _COMBO_ITEMS:
+            self.format_combo.addItem(display_name, format_key)
         self.format_combo.currentTextChanged.connect(self.filter_citations)
         filter_layout.addWidget(self.format_combo)
         filter_layout.addStretch()
@@ -434,17 +1012,10 @@ class DetailPanelWidget(QWidget):
 
     def create_references_tab(self):
         """Create references tab (새로 추가)"""
+        # 스크롤은 레퍼런스 목록 뷰만 담당 (탭 전체를 감싸는 스크롤 영역 없음)
         widget = QWidget()
-
-        # 전체 탭에 스크롤 적용
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        # 스크롤 내용 위젯
-        scroll_content = QWidget()
-        layout = QVBoxLayout(scroll_content)
+        self.references_content = widget
+        layout = QVBoxLayout(widget)
         layout.setSpacing(12)
 
         # Header section
@@ -462,30 +1033,62 @@ class DetailPanelWidget(QWidget):
         ref_stats_layout = QVBoxLayout(self.ref_stats_group)
 
         self.ref_count_label = QLabel("References: Loading...")
+        self.ref_count_label.setTextFormat(Qt.TextFormat.PlainText)
         self.ref_count_label.setStyleSheet("font-size: 12px; margin-bottom: 4px;")
         ref_stats_layout.addWidget(self.ref_count_label)
 
         self.cited_by_label = QLabel("Cited by: Loading...")
+        self.cited_by_label.setTextFormat(Qt.TextFormat.PlainText)
         self.cited_by_label.setStyleSheet("font-size: 12px; margin-bottom: 4px;")
         ref_stats_layout.addWidget(self.cited_by_label)
 
         self.paper_type_label = QLabel("Type: Loading...")
+        self.paper_type_label.setTextFormat(Qt.TextFormat.PlainText)
         self.paper_type_label.setStyleSheet("font-size: 12px; margin-bottom: 8px;")
         ref_stats_layout.addWidget(self.paper_type_label)
 
         layout.addWidget(self.ref_stats_group)
 
-        # References list section (스크롤 없이 전체 표시)
-        self.ref_list_group = QGroupBox("📋 Reference List")
-        ref_list_layout = QVBoxLayout(self.ref_list_group)
-
-        # References container (스크롤 없이 직접 추가)
-        self.references_widget = QWidget()
-        self.references_layout = QVBoxLayout(self.references_widget)
-        self.references_layout.setSpacing(6)
+        # References list section
+        ref_list_label = QLabel("📋 Reference List")
+        ref_list_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+        layout.addWidget(ref_list_label)
+
+        # References list view - 보이는 행만 그림
+        self.ref_model = ReferenceListModel(self)
+        self.ref_delegate = ReferenceItemDelegate(self)
+        self.ref_model.modelReset.connect(self.ref_delegate.clear_cache)
+
+        self.references_view = QListView()
+        self.references_view.setModel(self.ref_model)
+        self.references_view.setItemDelegate(self.ref_delegate)
+        self.references_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.references_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.references_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.references_view.setMinimumHeight(150)
+        self.references_view.setStyleSheet(
+            "QListView::item { background-color: #fafafa; "
+            "border-bottom: 1px solid #eee; }"
+            "QListView::item:hover { background-color: #f0f0f0; }"
+        )
+        layout.addWidget(self.references_view, 1)
 
-        ref_list_layout.addWidget(self.references_widget)
-        layout.addWidget(self.ref_list_group)
+        self.no_refs_label = QLabel("No reference list available for this paper.")
+        self.no_refs_label.setStyleSheet(
+            "font-style: italic; color: #666; padding: 20px; text-align: center;"
+        )
+        self.no_refs_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_refs_label.hide()
+        layout.addWidget(self.no_refs_label)
+
+        self.ref_total_label = QLabel()
+        self.ref_total_label.setStyleSheet(
+            "font-weight: bold; color: #1976D2; padding: 8px; "
+            "text-align: center; border-top: 1px solid #eee; margin-top: 10px;"
+        )
+        self.ref_total_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.ref_total_label.hide()
+        layout.addWidget(self.ref_total_label)
 
         # Info note
         info_label = QLabel(
@@ -499,14 +1102,8 @@ class DetailPanelWidget(QWidget):
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
 
-        # 스크롤 콘텐츠 완성
-        layout.addStretch()
-        scroll_area.setWidget(scroll_content)
-
-        # 메인 위젯 레이아웃
-        main_layout = QVBoxLayout(widget)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(scroll_area)
+        # 목록이 숨겨졌을 때만 남는 공간을 차지
+        layout.addStretch(0)
 
         return widget
 
@@ -515,11 +1112,11 @@ class DetailPanelWidget(QWidget):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        self.abstract_text = QTextEdit()
+        self.abstract_text = QPlainTextEdit()
         self.abstract_text.setReadOnly(True)
         self.abstract_text.setPlaceholderText("No abstract available")
         self.abstract_text.setStyleSheet(
-            "QTextEdit { font-size: 11px; line-height: 1.5; padding: 10px; }"
+            "QPlainTextEdit { font-size: 11px; padding: 10px; }"
         )
         layout.addWidget(self.abstract_text)
 
@@ -536,7 +1133,7 @@ class DetailPanelWidget(QWidget):
         )
         layout.addWidget(notes_label)
 
-        self.notes_text = QTextEdit()
+        self.notes_text = QPlainTextEdit()
         self.notes_text.setPlaceholderText(
             "Add your personal notes about this paper...\n\n"
             "• Key findings\n• Methodology notes\n• Questions for further research\n• Personal insights"
@@ -548,51 +1145,93 @@ class DetailPanelWidget(QWidget):
 
     def display_paper(self, paper_data):
         """Display paper details"""
+        # 이미 표시 중인 논문을 다시 선택한 경우 재구성하지 않음
+        # 목록과 트리는 시그널로 사본을 넘기므로 객체가 아닌 id로 비교
+        current = self.current_paper
+        if current is not None:
+            paper_id = paper_data.get("id")
+            if paper_data is current or (
+                paper_id is not None and paper_id == current.get("id")
+            ):
+                return
+
+        self.flush_pending_notes()
         self.current_paper = paper_data
+        self._display_token += 1
+
+        for key in self._dirty:
+            self._dirty[key] = True
+        self._refresh_current_tab(self.tabs.currentIndex())
+
+        # References 탭이 보이기 전에 표시 문자열을 백그라운드에서 미리 만들어 둠
+        if self.tabs.currentWidget() is not self.references_tab:
+            references = paper_data.get("reference_info", {}).get("references")
+            if references:
+                QThreadPool.globalInstance().start(ReferenceTextPrefetch(references))
+
+    def _refresh_current_tab(self, index):
+        """Populate the visible tab if it is out of date"""
+        if self.current_paper is None:
+            return
+
+        key = self._tab_keys.get(self.tabs.widget(index))
+        if key is None or not self._dirty[key]:
+            return
+
+        if key in DEFERRED_TABS:
+            # 무거운 탭은 이벤트 루프가 한 번 돈 뒤에 채움
+            token = self._display_token
+            QTimer.singleShot(0, lambda: self._finish_tab_refresh(token, key))
+            return
+
+        self._dirty[key] = False
+        self._tab_refreshers[key](self.current_paper)
+
+    def _finish_tab_refresh(self, token, key):
+        """Populate a deferred tab unless another paper was selected meanwhile"""
+        if token != self._display_token or self.current_paper is None:
+            return
+        if not self._dirty[key]:
+            return
+
+        self._dirty[key] = False
+        self._tab_refreshers[key](self.current_paper)
 
-        # Update details tab
+    def display_details(self, paper_data):
+        """Update details tab"""
         title = paper_data.get("title", "Unknown Title")
         self.title_label.setText(title)
 
         authors = paper_data.get("authors", [])
         if isinstance(authors, list):
-            authors_text = ", ".join(
-                [
-                    f"{author.get('given', '')} {author.get('family', '')}".strip()
+            authors_text = _format_authors(
+                tuple(
+                    (
+                        (str(author.get("given", "")), str(author.get("family", "")))
+                        if isinstance(author, dict)
+                        else str(author)
+                    )
                     for author in authors
-                    if isinstance(author, dict)
-                ]
+                )
             )
-            if not authors_text:
-                authors_text = ", ".join([str(author) for author in authors])
         else:
             authors_text = str(authors)
         self.authors_label.setText(f"Authors: {authors_text}")
 
         # Journal info with enhanced formatting
-        journal_parts = []
         journal = paper_data.get("container-title", ["Unknown Journal"])
         if isinstance(journal, list):
             journal = journal[0] if journal else "Unknown Journal"
-        journal_parts.append(journal)
-
-        year = self.extract_year(paper_data)
-        if year:
-            journal_parts.append(f"({year})")
-
-        volume = paper_data.get("volume", "")
-        if volume:
-            journal_parts.append(f"Vol. {volume}")
 
-        issue = paper_data.get("issue", "")
-        if issue:
-            journal_parts.append(f"Issue {issue}")
-
-        pages = paper_data.get("page", "")
-        if pages:
-            journal_parts.append(f"pp. {pages}")
-
-        self.journal_label.setText(" • ".join(journal_parts))
+        self.journal_label.setText(
+            _format_journal_line(
+                str(journal),
+                self.extract_year(paper_data),
+                str(paper_data.get("volume", "")),
+                str(paper_data.get("issue", "")),
+                str(paper_data.get("page", "")),
+            )
+        )
 
         # DOI with clickable link
         doi = paper_data.get("DOI", "")
@@ -607,21 +1246,19 @@ class DetailPanelWidget(QWidget):
         self.tag_widget.tags = tags.copy()
         self.tag_widget.refresh_tags()
 
-        # Update citations tab (모든 형식 표시)
-        self.display_citations(paper_data)
-
-        # Update references tab (새로 추가)
-        self.display_references(paper_data)
-
-        # Update abstract tab
+    def display_abstract(self, paper_data):
+        """Update abstract tab"""
         abstract = paper_data.get("abstract", "")
         self.abstract_text.setPlainText(
             abstract if abstract else "No abstract available"
         )
 
-        # Update notes tab
+    def display_notes(self, paper_data):
+        """Update notes tab"""
+        # 프로그램에서 설정하는 텍스트는 on_notes_changed로 되돌려 쓰지 않음
         notes = paper_data.get("notes", "")
-        self.notes_text.setPlainText(notes)
+        with QSignalBlocker(self.notes_text):
+            self.notes_text.setPlainText(notes)
 
     def display_references(self, paper_data):
         """Display reference information (새로 추가)"""
@@ -632,175 +1269,214 @@ class DetailPanelWidget(QWidget):
         cited_by_count = ref_info.get("is_referenced_by_count", 0)
         paper_type = paper_data.get("type", "unknown")
 
-        self.ref_count_label.setText(f"📚 References: {ref_count}")
-        self.cited_by_label.setText(f"📈 Cited by: {cited_by_count}")
-        self.paper_type_label.setText(f"🏷️ Type: {paper_type}")
+        references = ref_info.get("references", [])
 
-        # Clear existing reference widgets
-        for i in reversed(range(self.references_layout.count())):
-            child = self.references_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
+        # 같은 레퍼런스 목록 객체(길이도 같음)이면 목록은 다시 채우지 않음
+        ref_key = (references, len(references))
+        last_key = self._last_ref_key
+        unchanged = (
+            last_key is not None
+            and last_key[0] is references
+            and last_key[1] == len(references)
+        )
+        self._last_ref_key = ref_key
 
-        # Display reference list (모든 레퍼런스 표시, 제한 없음)
-        references = ref_info.get("references", [])
+        # 라벨/목록/표시 여부 변경을 한 번의 레이아웃과 그리기로 반영
+        with suspended_layout(self.references_content):
+            self.ref_count_label.setText(f"📚 References: {ref_count}")
+            self.cited_by_label.setText(f"📈 Cited by: {cited_by_count}")
+            self.paper_type_label.setText(f"🏷️ Type: {paper_type}")
+            if unchanged:
+                return
 
-        if not references:
-            no_refs_label = QLabel("No reference list available for this paper.")
-            no_refs_label.setStyleSheet(
-                "font-style: italic; color: #666; padding: 20px; text-align: center;"
-            )
-            no_refs_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.references_layout.addWidget(no_refs_label)
-        else:
-            # 모든 references 표시 (제한 없음)
-            for i, ref_data in enumerate(references, 1):
-                ref_widget = ReferenceItem(ref_data, i)
-                self.references_layout.addWidget(ref_widget)
+            # Display reference list (모든 레퍼런스 표시, 제한 없음)
+            self.ref_model.set_references(references)
+            self.references_view.setVisible(bool(references))
+            self.no_refs_label.setVisible(not references)
 
             # 총 개수 표시
             if len(references) > 10:  # 10개 이상일 때만 총 개수 표시
-                count_label = QLabel(f"📊 Total: {len(references)} references")
-                count_label.setStyleSheet(
-                    "font-weight: bold; color: #1976D2; padding: 8px; "
-                    "text-align: center; border-top: 1px solid #eee; margin-top: 10px;"
-                )
-                count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.references_layout.addWidget(count_label)
+                self.ref_total_label.setText(f"📊 Total: {len(references)} references")
+                self.ref_total_label.show()
+            else:
+                self.ref_total_label.hide()
+
+    def clear_references(self):
+        """Empty the reference list"""
+        self._last_ref_key = None
+        with suspended_layout(self.references_content):
+            self.ref_model.set_references([])
+            self.no_refs_label.hide()
+            self.ref_total_label.hide()
 
     def extract_year(self, paper_data):
         """Extract publication year"""
-        if "published-print" in paper_data:
-            date_parts = paper_data["published-print"].get("date-parts", [[]])
-            if date_parts and date_parts[0] and len(date_parts[0]) > 0:
-                return date_parts[0][0]
+        # 캐시에 논문 객체도 같이 보관해 id 재사용으로 다른 논문과 섞이지 않게 함
+        cached = self._year_cache.get(id(paper_data))
+        if cached is not None and cached[0] is paper_data:
+            return cached[1]
 
-        if "published-online" in paper_data:
-            date_parts = paper_data["published-online"].get("date-parts", [[]])
-            if date_parts and date_parts[0] and len(date_parts[0]) > 0:
-                return date_parts[0][0]
+        year = None
+        for key in ("published-print", "published-online"):
+            date_parts = (paper_data.get(key) or {}).get("date-parts")
+            if date_parts and date_parts[0]:
+                year = date_parts[0][0]
+                break
 
-        return None
+        self._year_cache[id(paper_data)] = (paper_data, year)
+        return year
 
     def display_citations(self, paper_data):
         """Display citations in all formats"""
-        # Clear existing citations
-        for i in reversed(range(self.citations_layout.count())):
-            child = self.citations_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
-
-        citations = paper_data.get("citations", {})
-
-        if not citations:
-            no_citations_label = QLabel("No citations available")
-            no_citations_label.setStyleSheet(
-                "font-style: italic; color: #666; padding: 20px;"
-            )
-            no_citations_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.citations_layout.addWidget(no_citations_label)
+        # 같은 DOI의 인용은 이미 표시되어 있으므로 다시 만들지 않음
+        doi = paper_data.get("DOI")
+        if doi and doi == self._last_citations_doi:
             return
-
-        # Group citations by category
-        academic_formats = [
-            "APA",
-            "IEEE",
-            "Nature",
-            "Science",
-            "Cell",
-            "PNAS",
-            "PLoS",
-            "Vancouver",
-        ]
-        standard_formats = ["MLA", "Chicago", "Harvard"]
-        export_formats = ["BibTeX", "RIS", "JSON"]
-
-        # Add citations in organized groups
-        self.add_citation_group("Academic Journals", academic_formats, citations)
-        self.add_citation_group("Standard Formats", standard_formats, citations)
-        self.add_citation_group("Export Formats", export_formats, citations)
-
-        self.citations_layout.addStretch()
-
-    def add_citation_group(self, group_name, format_keys, citations):
-        """Add a group of citations"""
-        has_citations = any(
-            format_key in citations and citations[format_key]
-            for format_key in format_keys
-        )
-
-        if not has_citations:
+        self._last_citations_doi = doi
+
+        # 위젯을 한꺼번에 추가하는 동안 레이아웃 재계산 중지
+        with suspended_layout(self.citations_widget):
+            self.populate_citations(paper_data.get("citations", {}))
+
+    def populate_citations(self, citations):
+        """Fill citations area grouped by format category"""
+        # Clear list views left in the citations area
+        self.clear_citations_area()
+        self.ensure_citation_pool()
+
+        # Update citations in organized groups
+        has_citations = False
+        for group_name, format_keys, format_keys_set in CITATION_GROUPS:
+            if self.add_citation_group(
+                group_name, format_keys, citations, format_keys_set
+            ):
+                has_citations = True
+
+        self.no_citations_label.setVisible(not has_citations)
+        self.citations_pool_widget.show()
+
+        # 재사용된 위젯에도 현재 필터 적용
+        self.filter_citations()
+
+    def ensure_citation_pool(self):
+        """Build group headers and one CitationDisplay per format once"""
+        if self.citations_pool_widget is not None:
             return
 
-        # Group header
-        group_label = QLabel(group_name)
-        group_label.setStyleSheet(
-            "font-weight: bold; font-size: 12px; color: #1976D2; "
-            "margin-top: 15px; margin-bottom: 5px;"
-        )
-        self.citations_layout.addWidget(group_label)
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        for group_name, format_keys, _ in CITATION_GROUPS:
+            # Group header
+            group_label = QLabel(group_name)
+            group_label.setObjectName("citationGroupHeader")
+            layout.addWidget(group_label)
+            self._group_headers[group_name] = group_label
+
+            for format_key in format_keys:
+                display_name = _DISPLAY_BY_KEY.get(format_key, format_key)
+                citation_widget = CitationDisplay(display_name, "")
+                citation_widget.copy_btn.clicked.connect(self._copy_via_sender)
+                layout.addWidget(citation_widget)
+                self._citation_pool[format_key] = citation_widget
+
+        self.no_citations_label = QLabel("No citations available")
+        self.no_citations_label.setObjectName("emptyMessage")
+        self.no_citations_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.no_citations_label)
+
+        layout.addStretch()
+
+        self.citations_pool_widget = container
+        self.citations_layout.addWidget(container)
 
-        # Add citations in this group
+    def ensure_paper_list(self):
+        """Build the shared paper list view and its empty label once"""
+        if self.paper_list_view is not None:
+            return
+
+        self.paper_list_view = QListView()
+        self.paper_list_view.setObjectName("paperList")
+        self.paper_list_view.setModel(self.paper_model)
+        self.paper_list_view.setItemDelegate(self.paper_delegate)
+        self.paper_list_view.setUniformItemSizes(True)
+        # 결과가 많아도 한 번에 전부 배치하지 않고 나눠서 배치
+        self.paper_list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.paper_list_view.setBatchSize(100)
+        self.paper_list_view.clicked.connect(self.on_paper_list_clicked)
+        self.citations_layout.addWidget(self.paper_list_view)
+
+        self.paper_list_empty_label = QLabel()
+        self.paper_list_empty_label.setObjectName("emptyMessage")
+        self.paper_list_empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.citations_layout.addWidget(self.paper_list_empty_label)
+
+    def show_paper_list(self, papers, empty_text, year_of=None):
+        """Show papers in the citations area, or empty_text if there are none"""
+        with suspended_layout(self.citations_widget):
+            self.clear_citations_area()
+            self.ensure_paper_list()
+
+            self.paper_model.set_papers(papers, year_of)
+            self.paper_list_view.setVisible(bool(papers))
+            self.paper_list_empty_label.setText(empty_text)
+            self.paper_list_empty_label.setVisible(not papers)
+
+    def clear_citations_area(self):
+        """Hide the paper list and pooled citations in the citations area"""
+        if self.citations_pool_widget is not None:
+            self.citations_pool_widget.hide()
+        if self.paper_list_view is not None:
+            self.paper_model.set_papers([])
+            self.paper_list_view.hide()
+            self.paper_list_empty_label.hide()
+
+    def add_citation_group(
+        self, group_name, format_keys, citations, format_keys_set=None
+    ):
+        """Update a group of pooled citations, returning whether any is shown"""
+        if format_keys_set is None:
+            format_keys_set = frozenset(format_keys)
+
+        in_group = not citations.keys().isdisjoint(format_keys_set)
+        has_citations = False
         for format_key in format_keys:
-            if format_key in citations and citations[format_key]:
-                format_info = CITATION_FORMATS.get(
-                    format_key, {"display_name": format_key}
-                )
-                citation_widget = CitationDisplay(
-                    format_info["display_name"], citations[format_key]
-                )
-                citation_widget.copy_requested.connect(self.show_copy_message)
-                self.citations_layout.addWidget(citation_widget)
+            text = (citations.get(format_key) or "") if in_group else ""
+            citation_widget = self._citation_pool[format_key]
+            citation_widget.set_citation(citation_widget.format_name, text)
+            if text:
+                has_citations = True
+
+        self._group_headers[group_name].setVisible(has_citations)
+        return has_citations
 
     def filter_citations(self):
         """Filter displayed citations"""
         filter_value = self.format_combo.currentData()
 
+        wanted = _FILTER_KEYS.get(filter_value) or frozenset((filter_value,))
+
         # Show/hide citation widgets based on filter
-        for i in range(self.citations_layout.count()):
-            item = self.citations_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, CitationDisplay):
-                    if filter_value == "all":
-                        widget.show()
-                    elif filter_value == "academic":
-                        academic_names = [
-                            CITATION_FORMATS[k]["display_name"]
-                            for k in [
-                                "APA",
-                                "IEEE",
-                                "Nature",
-                                "Science",
-                                "Cell",
-                                "PNAS",
-                                "PLoS",
-                                "Vancouver",
-                            ]
-                            if k in CITATION_FORMATS
-                        ]
-                        widget.setVisible(widget.format_name in academic_names)
-                    elif filter_value == "export":
-                        export_names = [
-                            CITATION_FORMATS[k]["display_name"]
-                            for k in ["BibTeX", "RIS", "JSON"]
-                            if k in CITATION_FORMATS
-                        ]
-                        widget.setVisible(widget.format_name in export_names)
-                    else:
-                        format_info = CITATION_FORMATS.get(filter_value, {})
-                        widget.setVisible(
-                            widget.format_name == format_info.get("display_name")
-                        )
+        for format_key, widget in self._citation_pool.items():
+            widget.setVisible(bool(widget.citation_text) and format_key in wanted)
 
     def display_project_papers(self, papers):
         """Display list of papers in a project"""
+        # 프로젝트가 바뀌면 이전 논문들의 연도 캐시는 필요 없음
+        self._year_cache.clear()
+
         # Clear current display
         self.title_label.setText("📁 Project Papers")
         self.authors_label.setText(f"{len(papers)} papers in this project")
         self.journal_label.setText("")
         self.doi_label.setText("")
 
+        # 목록 표시 후에는 어떤 논문을 선택해도 다시 그려야 함
+        self.flush_pending_notes()
+        self.current_paper = None
+        self._last_citations_doi = None
+
         # Clear other tabs
         self.abstract_text.setPlaceholderText("Select a paper to view its abstract")
         self.notes_text.setPlaceholderText("")
@@ -810,59 +1486,10 @@ class DetailPanelWidget(QWidget):
         self.cited_by_label.setText("Cited by: N/A")
         self.paper_type_label.setText("Type: N/A")
 
-        for i in reversed(range(self.references_layout.count())):
-            child = self.references_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
+        self.clear_references()
 
         # Show paper list in citations tab
-        for i in reversed(range(self.citations_layout.count())):
-            child = self.citations_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
-
-        if papers:
-            list_widget = QListWidget()
-            list_widget.setStyleSheet(
-                """
-                QListWidget::item { 
-                    padding: 8px; 
-                    border-bottom: 1px solid #eee; 
-                }
-                QListWidget::item:selected { 
-                    background-color: #e3f2fd; 
-                }
-                QListWidget::item:hover { 
-                    background-color: #f0f8ff; 
-                }
-            """
-            )
-
-            for paper in papers:
-                title = paper.get("title", "Unknown Title")
-                authors = paper.get("authors", [])
-
-                if isinstance(authors, list) and authors:
-                    first_author = authors[0]
-                    if isinstance(first_author, dict):
-                        author_name = f"{first_author.get('given', '')} {first_author.get('family', '')}".strip()
-                    else:
-                        author_name = str(first_author)
-                else:
-                    author_name = "Unknown Author"
-
-                item_text = f"{title}\n{author_name}"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, paper)
-                list_widget.addItem(item)
-
-            list_widget.itemClicked.connect(self.on_paper_list_clicked)
-            self.citations_layout.addWidget(list_widget)
-        else:
-            empty_label = QLabel("No papers in this project")
-            empty_label.setStyleSheet("font-style: italic; color: #666; padding: 20px;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.citations_layout.addWidget(empty_label)
+        self.show_paper_list(papers, "No papers in this project")
 
     def display_search_results(self, results):
         """Display search results"""
@@ -871,6 +1498,11 @@ class DetailPanelWidget(QWidget):
         self.journal_label.setText("")
         self.doi_label.setText("")
 
+        # 목록 표시 후에는 어떤 논문을 선택해도 다시 그려야 함
+        self.flush_pending_notes()
+        self.current_paper = None
+        self._last_citations_doi = None
+
         # Clear other tabs
         self.abstract_text.setPlaceholderText("Select a paper to view its abstract")
         self.notes_text.setPlaceholderText("")
@@ -880,69 +1512,16 @@ class DetailPanelWidget(QWidget):
         self.cited_by_label.setText("Cited by: N/A")
         self.paper_type_label.setText("Type: N/A")
 
-        for i in reversed(range(self.references_layout.count())):
-            child = self.references_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
+        self.clear_references()
 
         # Show results in citations tab
-        for i in reversed(range(self.citations_layout.count())):
-            child = self.citations_layout.itemAt(i).widget()
-            if child:
-                child.deleteLater()
-
-        if results:
-            list_widget = QListWidget()
-            list_widget.setStyleSheet(
-                """
-                QListWidget::item { 
-                    padding: 10px; 
-                    border-bottom: 1px solid #eee; 
-                }
-                QListWidget::item:selected { 
-                    background-color: #e3f2fd; 
-                }
-                QListWidget::item:hover { 
-                    background-color: #f0f8ff; 
-                }
-            """
-            )
-
-            for paper in results:
-                title = paper.get("title", "Unknown Title")
-                authors = paper.get("authors", [])
-
-                if isinstance(authors, list) and authors:
-                    first_author = authors[0]
-                    if isinstance(first_author, dict):
-                        author_name = f"{first_author.get('given', '')} {first_author.get('family', '')}".strip()
-                    else:
-                        author_name = str(first_author)
-                else:
-                    author_name = "Unknown Author"
-
-                # Add publication year if available
-                year = self.extract_year(paper)
-                year_text = f" ({year})" if year else ""
-
-                item_text = f"{title}{year_text}\n{author_name}"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, paper)
-                list_widget.addList(item)
-
-            list_widget.itemClicked.connect(self.on_paper_list_clicked)
-            self.citations_layout.addWidget(list_widget)
-        else:
-            no_results_label = QLabel("No papers found matching your search")
-            no_results_label.setStyleSheet(
-                "font-style: italic; color: #666; padding: 20px;"
-            )
-            no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.citations_layout.addWidget(no_results_label)
+        self.show_paper_list(
+            results, "No papers found matching your search", self.extract_year
+        )
 
-    def on_paper_list_clicked(self, item):
+    def on_paper_list_clicked(self, index):
         """Handle paper list item click"""
-        paper_data = item.data(Qt.ItemDataRole.UserRole)
+        paper_data = index.data(Qt.ItemDataRole.UserRole)
         self.display_paper(paper_data)
 
     def on_tags_changed(self, tags):
@@ -953,10 +1532,32 @@ class DetailPanelWidget(QWidget):
 
     def on_notes_changed(self):
         """Handle notes changes"""
+        if self.current_paper:
+            self._notes_timer.start()
+
+    def flush_pending_notes(self):
+        """Apply notes edits still waiting on the debounce timer"""
+        if self._notes_timer.isActive():
+            self._notes_timer.stop()
+            self._flush_notes()
+
+    def _flush_notes(self):
+        """Write pending notes text to current paper"""
         if self.current_paper:
             self.current_paper["notes"] = self.notes_text.toPlainText()
             # TODO: Save changes to storage
 
+    def _copy_via_sender(self):
+        """Copy citation of the clicked copy button to clipboard"""
+        button = self.sender()
+        if button is None:
+            return
+
+        QApplication.clipboard().setText(button.property("citation_text"))
+        self.show_copy_message(
+            f"Copied {button.property('format_name')} citation to clipboard"
+        )
+
     def show_copy_message(self, message):
         """Show copy confirmation message"""
         # Show temporary message (could be enhanced with toast notifications)
@@ -5,6 +5,10 @@ DOI Input Widget for DOI Citation Manager
 - 로딩 UI
 """
 
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 from PyQt6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -20,17 +24,42 @@ from PyQt6.QtWidgets import (
     QButtonGroup,
     QRadioButton,
     QFrame,
+    QApplication,
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QRect
-from PyQt6.QtGui import QFont, QMovie
+from PyQt6.QtGui import QFont, QFontMetrics, QMovie, QPainter, QPalette, QPixmap
 
-from core.doi_converter import DOIConverter
+from config import NETWORK_SETTINGS
 from utils.doi_validator import DOIValidator
 
+# 일괄 변환 중 상태 메시지를 보내는 최소 간격 (초)
+STATUS_UPDATE_INTERVAL = 0.1
+
+# 일괄 변환 중 취소 여부를 확인하는 간격 (초)
+CANCEL_CHECK_INTERVAL = 0.1
+
+# DOI를 추출할 수 있는 입력에는 반드시 이 중 하나가 있음
+# ("10." 또는 DOI를 만들어 주는 논문 사이트, URL 인코딩된 경우 "%")
+DOI_HINT_RE = re.compile(r"10\.|%|nature\.com|sciencemag\.org|pnas\.org", re.I)
+
+# 정리할 것이 없는 순수 DOI 한 줄 (검증기를 거쳐도 그대로 반환되는 형태)
+BARE_DOI_RE = re.compile(r"10\.[0-9]{4,}/[^\s\]>,;?#]*[^\s\]>,;?#/]")
+
+# 상태 메시지 종류별 스타일 (state 동적 속성으로 선택, 위젯에 한 번만 적용)
+STATUS_QSS = """
+QLabel#doiStatus { color: #666; font-size: 10px; }
+QLabel#doiStatus[state="ok"] { color: #4CAF50; }
+QLabel#doiStatus[state="info"] { color: #2196F3; }
+QLabel#doiStatus[state="warning"] { color: #FF9800; }
+QLabel#doiStatus[state="error"] { color: #F44336; }
+"""
+
 
 class LoadingWidget(QFrame):
     """로딩 애니메이션을 위한 커스텀 위젯"""
 
+    ICONS = ("🔄", "🔃", "⟳", "⟲")
+
     def __init__(self):
         super().__init__()
         self.setup_ui()
@@ -70,17 +99,48 @@ class LoadingWidget(QFrame):
         self.rotation_timer = QTimer()
         self.rotation_timer.timeout.connect(self.rotate_icon)
         self.rotation_angle = 0
+        self.icon_frames = None
+
+    def build_icon_frames(self):
+        """Render each spinner icon to a pixmap once"""
+        label = self.loading_icon
+        label.ensurePolished()
+        font = label.font()
+        side = QFontMetrics(font).height()
+        ratio = self.devicePixelRatioF()
+        color = label.palette().color(QPalette.ColorRole.WindowText)
+
+        frames = []
+        for icon in self.ICONS:
+            pixmap = QPixmap(int(side * ratio), int(side * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(
+                QRect(0, 0, side, side), Qt.AlignmentFlag.AlignCenter, icon
+            )
+            painter.end()
+            frames.append(pixmap)
+
+        # 크기를 고정해 프레임이 바뀌어도 레이아웃을 다시 계산하지 않음
+        label.setFixedSize(side, side)
+        return frames
 
     def rotate_icon(self):
         """아이콘 회전"""
-        icons = ["🔄", "🔃", "⟳", "⟲"]
-        self.rotation_angle = (self.rotation_angle + 1) % len(icons)
-        self.loading_icon.setText(icons[self.rotation_angle])
+        self.rotation_angle = (self.rotation_angle + 1) % len(self.ICONS)
+        # 이모지를 매번 다시 그리지 않고 미리 만든 프레임만 교체
+        self.loading_icon.setPixmap(self.icon_frames[self.rotation_angle])
 
     def start_loading(self, message="Converting DOI..."):
         """로딩 시작"""
         self.loading_text.setText(message)
         self.show()
+        if self.icon_frames is None:
+            self.icon_frames = self.build_icon_frames()
+            self.loading_icon.setPixmap(self.icon_frames[self.rotation_angle])
         self.rotation_timer.start(200)  # 200ms마다 회전
 
     def stop_loading(self):
@@ -96,30 +156,96 @@ class DOIConversionThread(QThread):
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
     status_update = pyqtSignal(str)  # 상태 업데이트용
+    paper_ready = pyqtSignal(dict)  # 변환된 논문을 입력 순서대로 하나씩 전달
 
-    def __init__(self, doi_list):
-        super().__init__()
+    def __init__(self, doi_list, converter, parent=None):
+        super().__init__(parent)
         self.doi_list = doi_list
-        self.converter = DOIConverter()
+        # 모든 작업 스레드가 같은 converter의 연결 풀을 재사용
+        self.converter = converter
+        self._cancelled = False
 
-    def run(self):
-        results = []
-        total = len(self.doi_list)
-
-        for i, doi in enumerate(self.doi_list):
-            try:
-                self.status_update.emit(f"Converting {i+1}/{total}: {doi[:30]}...")
+    def cancel(self):
+        """Stop converting; DOIs already being fetched are discarded"""
+        self._cancelled = True
 
-                # 모든 형식을 자동으로 생성
-                paper_data = self.converter.convert_doi(doi)
-                results.append(paper_data)
-                self.progress.emit(int((i + 1) / total * 100))
+    def convert(self, doi):
+        """Convert one DOI on a worker thread (모든 형식을 자동으로 생성)"""
+        if self._cancelled:
+            return None
+        return self.converter.convert_doi(doi)
 
-            except Exception as e:
-                self.error.emit(f"Error converting {doi}: {str(e)}")
-                continue
+    def run(self):
+        total = len(self.doi_list)
+        results = [None] * total
+        done = [False] * total
+        next_index = 0
+        completed = 0
+        last_percent = -1
+        last_status_time = 0.0
+
+        # 네트워크 대기가 대부분이므로 여러 DOI를 동시에 요청
+        max_workers = max(1, min(NETWORK_SETTINGS["max_connections"], total))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(self.convert, doi): (i, doi)
+                for i, doi in enumerate(self.doi_list)
+            }
+            pending = set(futures)
+            # 진행 중인 요청이 끝나기를 기다리지 않고 주기적으로 취소 여부 확인
+            while pending and not self._cancelled:
+                done_futures, pending = wait(
+                    pending,
+                    timeout=CANCEL_CHECK_INTERVAL,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done_futures:
+                    if self._cancelled:
+                        break
+
+                    i, doi = futures[future]
+                    completed += 1
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        self.error.emit(f"Error converting {doi}: {str(e)}")
+                    done[i] = True
+
+                    # 앞선 DOI가 모두 끝났으면 기다리지 않고 바로 전달
+                    while next_index < total and done[next_index]:
+                        if results[next_index] is not None:
+                            self.paper_ready.emit(results[next_index])
+                        next_index += 1
+
+                    # 스레드 간 시그널은 이벤트로 쌓이므로 바뀔 때만, 너무 자주 보내지 않음
+                    now = time.monotonic()
+                    if (
+                        completed == total
+                        or now - last_status_time >= STATUS_UPDATE_INTERVAL
+                    ):
+                        # 긴 DOI만 잘라서 표시
+                        label = doi if len(doi) <= 30 else f"{doi[:30]}..."
+                        self.status_update.emit(
+                            f"Converted {completed}/{total}: {label}"
+                        )
+                        last_status_time = now
+
+                    percent = completed * 100 // total
+                    if percent != last_percent:
+                        self.progress.emit(percent)
+                        last_percent = percent
+        finally:
+            # 취소되면 대기 중인 DOI는 버리고 진행 중인 요청도 기다리지 않음
+            executor.shutdown(wait=not self._cancelled, cancel_futures=True)
+
+        if self._cancelled:
+            return
 
-        self.finished.emit({"papers": results})
+        # 입력 순서 유지
+        self.finished.emit(
+            {"papers": [paper for paper in results if paper is not None]}
+        )
 
 
 class BatchConvertDialog(QDialog):
@@ -127,13 +253,35 @@ class BatchConvertDialog(QDialog):
 
     batch_completed = pyqtSignal(list)
 
-    def __init__(self, parent=None):
+    # 변환된 논문을 모아서 전달하는 간격 (ms)
+    FLUSH_INTERVAL = 250
+    # 안내 메시지를 표시하는 시간 (ms)
+    MESSAGE_DURATION = 3000
+
+    def __init__(self, converter, parent=None):
         super().__init__(parent)
+        self.converter = converter
         self.setWindowTitle("Batch DOI Conversion")
         self.setModal(True)
         self.resize(600, 450)
+
+        self.conversion_thread = None
+        # 취소했지만 진행 중인 요청 때문에 아직 끝나지 않은 스레드
+        self._cancelled_threads = []
+        self._ready_papers = []
+        self._errors = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush_ready_papers)
+
         self.setup_ui()
 
+        self._message_timer = QTimer(self)
+        self._message_timer.setSingleShot(True)
+        self._message_timer.setInterval(self.MESSAGE_DURATION)
+        self._message_timer.timeout.connect(self.message_label.hide)
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
 
@@ -155,6 +303,13 @@ class BatchConvertDialog(QDialog):
         )
         layout.addWidget(self.doi_text)
 
+        # 입력 오류 안내 (모달 메시지 상자 대신 잠시 표시)
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        self.message_label.setStyleSheet("font-size: 11px; color: #F44336;")
+        self.message_label.hide()
+        layout.addWidget(self.message_label)
+
         # Progress section
         progress_frame = QFrame()
         progress_frame.setFrameStyle(QFrame.Shape.StyledPanel)
@@ -193,32 +348,78 @@ class BatchConvertDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def reset(self):
+        """Clear input and progress so the dialog can be shown again"""
+        self.doi_text.clear()
+        self.progress_frame.setVisible(False)
+        self.progress_bar.setValue(0)
+        self.status_label.setText("Ready")
+        self.convert_btn.setEnabled(True)
+        self.convert_btn.setText("🔄 Convert All DOIs")
+        self._message_timer.stop()
+        self.message_label.hide()
+        self._ready_papers = []
+        self._errors = []
+
+    def flash_message(self, message):
+        """Show a short, non-blocking message above the progress section"""
+        self.message_label.setText(message)
+        self.message_label.show()
+        self._message_timer.start()
+
     def start_conversion(self):
         """Start batch conversion process"""
         doi_text = self.doi_text.toPlainText().strip()
         if not doi_text:
-            QMessageBox.warning(self, "Warning", "Please enter at least one DOI or URL")
+            self.flash_message("Please enter at least one DOI or URL")
             return
 
         # Extract DOIs from text (improved)
-        lines = [line.strip() for line in doi_text.split("\n") if line.strip()]
+        lines = filter(None, map(str.strip, doi_text.splitlines()))
 
         # Validate and extract DOIs
         validator = DOIValidator()
+        extract_doi = validator.extract_doi_from_input
+        extract_all = validator.extract_dois_from_text
+        is_valid_format = validator.is_valid_doi_format
+        is_bare_doi = BARE_DOI_RE.fullmatch
         valid_dois = []
         invalid_inputs = []
 
         for line in lines:
+            # 대부분의 줄은 순수 DOI이므로 정규식 한 번으로 처리
+            if is_bare_doi(line):
+                valid_dois.append(line)
+                continue
+
             try:
+                # 한 줄에 DOI가 여러 개 있으면 모두 사용
+                if line.count("10.") > 1:
+                    found_dois = extract_all(line)
+                    if len(found_dois) > 1:
+                        valid_dois.extend(found_dois)
+                        continue
+
                 # 향상된 DOI 추출
-                extracted_doi = validator.extract_doi_from_input(line)
-                if extracted_doi and validator.is_valid_doi_format(extracted_doi):
+                extracted_doi = extract_doi(line)
+                if extracted_doi and is_valid_format(extracted_doi):
                     valid_dois.append(extracted_doi)
                 else:
                     invalid_inputs.append(line)
             except Exception:
                 invalid_inputs.append(line)
 
+        # 같은 DOI는 한 번만 변환 (DOI는 대소문자를 구분하지 않음)
+        unique_dois = {}
+        for doi in valid_dois:
+            unique_dois.setdefault(doi.lower(), doi)
+        duplicate_count = len(valid_dois) - len(unique_dois)
+        valid_dois = list(unique_dois.values())
+
+        duplicate_note = (
+            f" ({duplicate_count} duplicates removed)" if duplicate_count else ""
+        )
+
         if invalid_inputs:
             reply = QMessageBox.question(
                 self,
@@ -226,13 +427,13 @@ class BatchConvertDialog(QDialog):
                 f"Found {len(invalid_inputs)} invalid inputs:\n"
                 + "\n".join(invalid_inputs[:5])  # Show first 5
                 + ("..." if len(invalid_inputs) > 5 else "")
-                + f"\n\nContinue with {len(valid_dois)} valid DOIs?",
+                + f"\n\nContinue with {len(valid_dois)} valid DOIs{duplicate_note}?",
             )
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
         if not valid_dois:
-            QMessageBox.warning(self, "Error", "No valid DOIs found")
+            self.flash_message("No valid DOIs found")
             return
 
         # Start conversion
@@ -240,22 +441,87 @@ class BatchConvertDialog(QDialog):
         self.progress_bar.setMaximum(100)
         self.convert_btn.setEnabled(False)
         self.convert_btn.setText("Converting...")
+        if duplicate_count:
+            self.status_label.setText(
+                f"Converting {len(valid_dois)} DOIs{duplicate_note}"
+            )
+
+        # 끝난 스레드는 해제 (취소 후 실행 중인 스레드는 대화상자가 부모로 유지)
+        if self.conversion_thread is not None:
+            self.conversion_thread.deleteLater()
+        still_running = []
+        for thread in self._cancelled_threads:
+            if thread.isFinished():
+                thread.deleteLater()
+            else:
+                still_running.append(thread)
+        self._cancelled_threads = still_running
 
-        self.conversion_thread = DOIConversionThread(valid_dois)
+        # 일괄 변환마다 새 스레드 사용
+        self.conversion_thread = DOIConversionThread(valid_dois, self.converter, self)
+        self.conversion_thread.paper_ready.connect(self.on_paper_ready)
         self.conversion_thread.finished.connect(self.on_conversion_finished)
         self.conversion_thread.error.connect(self.on_conversion_error)
         self.conversion_thread.progress.connect(self.progress_bar.setValue)
         self.conversion_thread.status_update.connect(self.status_label.setText)
         self.conversion_thread.start()
 
+    def on_paper_ready(self, paper_data):
+        """Queue a converted paper for the next flush"""
+        self._ready_papers.append(paper_data)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_ready_papers(self):
+        """Emit the papers converted since the last flush"""
+        self._flush_timer.stop()
+        if self._ready_papers:
+            papers, self._ready_papers = self._ready_papers, []
+            self.batch_completed.emit(papers)
+
     def on_conversion_finished(self, result):
         """Handle conversion completion"""
-        self.batch_completed.emit(result["papers"])
+        # 모든 논문은 paper_ready로 이미 받았으므로 남은 것만 전달
+        self.flush_ready_papers()
+
+        # 실패한 DOI는 변환이 끝난 뒤 한 번에 알림
+        if self._errors:
+            QMessageBox.warning(
+                self,
+                "Conversion Errors",
+                f"{len(self._errors)} DOIs could not be converted:\n"
+                + "\n".join(self._errors[:5])
+                + ("\n..." if len(self._errors) > 5 else ""),
+            )
         self.accept()
 
     def on_conversion_error(self, error_msg):
         """Handle conversion error"""
-        QMessageBox.warning(self, "Conversion Error", error_msg)
+        # 변환 중에는 모달 창으로 멈추지 않고 표시만 함
+        self._errors.append(error_msg)
+        self.flash_message(error_msg)
+
+    def reject(self):
+        """Cancel a running conversion before closing the dialog"""
+        thread = self.conversion_thread
+        if thread is not None and thread.isRunning():
+            # 스레드는 곧 스스로 끝나므로 기다리지 않고 닫음
+            # 다시 연 대화상자에 진행 상황이 표시되지 않게 연결을 끊고 떼어 둠
+            thread.cancel()
+            for signal in (
+                thread.paper_ready,
+                thread.finished,
+                thread.error,
+                thread.progress,
+                thread.status_update,
+            ):
+                signal.disconnect()
+            self._cancelled_threads.append(thread)
+            self.conversion_thread = None
+
+        # 취소 전에 변환된 논문은 그대로 추가
+        self.flush_ready_papers()
+        super().reject()
 
 
 class DOIInputWidget(QWidget):
@@ -263,12 +529,21 @@ class DOIInputWidget(QWidget):
 
     doi_converted = pyqtSignal(dict)  # Single DOI conversion
     batch_converted = pyqtSignal(list)  # Batch conversion
+    batch_started = pyqtSignal()  # 일괄 변환 대화상자를 열 때
 
     def __init__(self):
         super().__init__()
-        self.converter = DOIConverter()
+        self.converter = None  # 첫 변환 때 생성 (get_converter)
         self.validator = DOIValidator()
         self.conversion_thread = None
+        self.batch_dialog = None
+
+        # 입력이 잠시 멈춘 뒤에만 실시간 검증 실행
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self.validate_current_input)
+
         self.setup_ui()
         self.connect_signals()
 
@@ -320,7 +595,8 @@ class DOIInputWidget(QWidget):
 
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #666; font-size: 10px;")
+        self.status_label.setObjectName("doiStatus")
+        self.status_label.setProperty("state", "idle")
         status_layout.addWidget(self.status_label)
 
         # Loading widget
@@ -329,6 +605,8 @@ class DOIInputWidget(QWidget):
 
         layout.addWidget(status_frame)
 
+        self.setStyleSheet(STATUS_QSS)
+
     def connect_signals(self):
         """Connect widget signals"""
         self.doi_input.returnPressed.connect(self.convert_doi)
@@ -336,7 +614,24 @@ class DOIInputWidget(QWidget):
         self.batch_btn.clicked.connect(self.show_batch_dialog)
 
         # Real-time validation
-        self.doi_input.textChanged.connect(self.validate_input)
+        self.doi_input.textChanged.connect(self.on_input_text_changed)
+
+    def on_input_text_changed(self, text):
+        """Restart the validation debounce timer"""
+        if not text:
+            # 입력을 지운 경우는 바로 상태를 초기화
+            self._validate_timer.stop()
+            self.validate_input(text)
+            return
+
+        self._validate_timer.start()
+
+    def validate_current_input(self):
+        """Validate the text currently in the input field"""
+        # 변환 중에는 버튼과 상태 표시를 건드리지 않음
+        if self.conversion_thread is not None and self.conversion_thread.isRunning():
+            return
+        self.validate_input(self.doi_input.text())
 
     def validate_input(self, text):
         """Validate input in real-time"""
@@ -347,38 +642,70 @@ class DOIInputWidget(QWidget):
 
         try:
             # 향상된 DOI 추출 시도
-            extracted_doi = self.validator.extract_doi_from_input(text)
-            if extracted_doi and self.validator.is_valid_doi_format(extracted_doi):
-                self.status_label.setText(f"✓ Valid DOI found: {extracted_doi}")
-                self.status_label.setStyleSheet("color: #4CAF50; font-size: 10px;")
+            extracted_doi = self.resolve_input_doi(text)
+            if extracted_doi:
+                self.set_status(f"✓ Valid DOI found: {extracted_doi}", "ok")
                 self.convert_btn.setEnabled(True)
             else:
-                self.status_label.setText("⚠ No valid DOI found in input")
-                self.status_label.setStyleSheet("color: #FF9800; font-size: 10px;")
+                self.set_status("⚠ No valid DOI found in input", "warning")
                 self.convert_btn.setEnabled(False)
         except Exception:
-            self.status_label.setText("⚠ Unable to process input")
-            self.status_label.setStyleSheet("color: #FF9800; font-size: 10px;")
+            self.set_status("⚠ Unable to process input", "warning")
             self.convert_btn.setEnabled(False)
 
+    def set_status(self, text, state):
+        """Show a status message, restyling the label only when state changes"""
+        label = self.status_label
+        label.setText(text)
+        # 스타일시트를 다시 파싱하지 않고 속성 선택자만 다시 적용
+        if label.property("state") != state:
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
+
+    def get_converter(self):
+        """Return the shared DOIConverter, importing it on first use"""
+        if self.converter is None:
+            # requests 등 변환에만 필요한 모듈은 시작할 때 불러오지 않음
+            from core.doi_converter import DOIConverter
+
+            self.converter = DOIConverter()
+        return self.converter
+
+    def resolve_input_doi(self, text):
+        """Return the valid DOI found in text, or None"""
+        # DOI가 있을 수 없는 입력은 전체 검증기를 거치지 않음
+        if not DOI_HINT_RE.search(text):
+            return None
+
+        doi = self.validator.extract_doi_from_input(text)
+        if not doi or not self.validator.is_valid_doi_format(doi):
+            return None
+        return doi
+
     def convert_doi(self):
         """Convert single DOI/URL"""
+        # 대기 중인 실시간 검증이 변환 중 상태를 덮어쓰지 않게 함
+        self._validate_timer.stop()
+
+        # 이전 변환이 끝나기 전에는 새 변환을 시작하지 않음
+        if self.conversion_thread is not None and self.conversion_thread.isRunning():
+            return
+
         input_text = self.doi_input.text().strip()
         if not input_text:
             return
 
         try:
             # 향상된 DOI 추출
-            doi = self.validator.extract_doi_from_input(input_text)
-            if not doi or not self.validator.is_valid_doi_format(doi):
-                QMessageBox.warning(
-                    self,
-                    "Invalid Input",
-                    "Please enter a valid DOI or URL containing a DOI",
+            doi = self.resolve_input_doi(input_text)
+            if not doi:
+                self.set_status(
+                    "⚠ Please enter a valid DOI or URL containing a DOI", "warning"
                 )
                 return
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to process input: {str(e)}")
+            self.set_status(f"⚠ Failed to process input: {str(e)}", "warning")
             return
 
         # UI 상태 변경
@@ -389,14 +716,17 @@ class DOIInputWidget(QWidget):
 
         # 로딩 시작
         self.loading_widget.start_loading("Fetching paper metadata...")
-        self.status_label.setText("🔍 Connecting to DOI service...")
-        self.status_label.setStyleSheet("color: #2196F3; font-size: 10px;")
-
-        # 백그라운드 스레드에서 변환 수행
-        self.conversion_thread = SingleDOIConversionThread(doi)
-        self.conversion_thread.finished.connect(self.on_single_conversion_finished)
-        self.conversion_thread.error.connect(self.on_single_conversion_error)
-        self.conversion_thread.status_update.connect(self.on_conversion_status_update)
+        self.set_status("🔍 Connecting to DOI service...", "info")
+
+        # 백그라운드 스레드에서 변환 수행 (스레드 객체와 연결은 한 번만 만듦)
+        if self.conversion_thread is None:
+            thread = SingleDOIConversionThread(self.get_converter())
+            thread.finished.connect(self.on_single_conversion_finished)
+            thread.error.connect(self.on_single_conversion_error)
+            thread.status_update.connect(self.on_conversion_status_update)
+            self.conversion_thread = thread
+
+        self.conversion_thread.doi = doi
         self.conversion_thread.start()
 
     def on_conversion_status_update(self, message):
@@ -409,8 +739,7 @@ class DOIInputWidget(QWidget):
         self.reset_ui_state()
 
         # 성공 메시지
-        self.status_label.setText("✓ Converted successfully")
-        self.status_label.setStyleSheet("color: #4CAF50; font-size: 10px;")
+        self.set_status("✓ Converted successfully", "ok")
 
         # Emit signal with paper data
         self.doi_converted.emit(paper_data)
@@ -435,8 +764,7 @@ class DOIInputWidget(QWidget):
             self, "Conversion Error", f"Failed to convert DOI:\n{error_msg}"
         )
 
-        self.status_label.setText("✗ Conversion failed")
-        self.status_label.setStyleSheet("color: #F44336; font-size: 10px;")
+        self.set_status("✗ Conversion failed", "error")
 
     def reset_ui_state(self):
         """Reset UI to normal state"""
@@ -448,14 +776,17 @@ class DOIInputWidget(QWidget):
 
     def show_batch_dialog(self):
         """Show batch conversion dialog"""
-        dialog = BatchConvertDialog(self)
-        dialog.batch_completed.connect(self.batch_converted.emit)
-        dialog.exec()
+        # 대화상자는 처음 열 때 한 번만 만들고 이후에는 초기화해서 재사용
+        if self.batch_dialog is None:
+            self.batch_dialog = BatchConvertDialog(self.get_converter(), self)
+            self.batch_dialog.batch_completed.connect(self.batch_converted.emit)
+        else:
+            self.batch_dialog.reset()
+        self.batch_started.emit()
+        self.batch_dialog.exec()
 
     def paste_and_convert(self):
         """Paste from clipboard and convert"""
-        from PyQt6.QtWidgets import QApplication
-
         clipboard = QApplication.clipboard()
         text = clipboard.text().strip()
 
@@ -467,14 +798,11 @@ class DOIInputWidget(QWidget):
                     self.doi_input.setText(text)
                     self.convert_doi()
                 else:
-                    self.status_label.setText("No valid DOI found in clipboard")
-                    self.status_label.setStyleSheet("color: #FF9800; font-size: 10px;")
+                    self.set_status("No valid DOI found in clipboard", "warning")
             except Exception:
-                self.status_label.setText("Unable to process clipboard content")
-                self.status_label.setStyleSheet("color: #FF9800; font-size: 10px;")
+                self.set_status("Unable to process clipboard content", "warning")
         else:
-            self.status_label.setText("Clipboard is empty")
-            self.status_label.setStyleSheet("color: #FF9800; font-size: 10px;")
+            self.set_status("Clipboard is empty", "warning")
 
 
 class SingleDOIConversionThread(QThread):
@@ -484,10 +812,10 @@ class SingleDOIConversionThread(QThread):
     error = pyqtSignal(str)
     status_update = pyqtSignal(str)
 
-    def __init__(self, doi):
+    def __init__(self, converter):
         super().__init__()
-        self.doi = doi
-        self.converter = DOIConverter()
+        self.doi = None  # start() 전에 변환할 DOI를 지정
+        self.converter = converter
 
     def run(self):
         try:
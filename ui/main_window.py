@@ -12,8 +12,9 @@ from PyQt6.QtWidgets import (
     QMenuBar,
     QStatusBar,
     QMessageBox,
+    QDialog,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QAction, QKeySequence, QIcon
 
 from .doi_input import DOIInputWidget
@@ -21,38 +22,86 @@ from .project_tree import ProjectTreeWidget
 from .detail_panel import DetailPanelWidget
 from .search_bar import SearchBarWidget
 from .theme_manager import ThemeManager
-from core.doi_converter import DOIConverter
 from core.project_manager import ProjectManager
 from core.paper_manager import PaperManager
 from config import APP_NAME, VERSION, SHORTCUTS
 
+# 메뉴 구성: (메뉴 이름, 항목들), 항목은 (텍스트, 단축키, 슬롯 이름) 또는 구분선(None)
+MENU_LAYOUT = (
+    (
+        "&File",
+        (
+            ("&New Project", SHORTCUTS["new_project"], "new_project"),
+            None,
+            ("&Import...", SHORTCUTS["import"], "import_data"),
+            ("&Export...", SHORTCUTS["export"], "export_data"),
+            None,
+            ("E&xit", QKeySequence.StandardKey.Quit, "close"),
+        ),
+    ),
+    (
+        "&Edit",
+        (
+            ("&Search", SHORTCUTS["search"], "focus_search"),
+            (
+                "&Paste DOI and Convert",
+                SHORTCUTS["paste_doi"],
+                "paste_and_convert_doi",
+            ),
+        ),
+    ),
+    ("&View", (("Toggle &Theme", SHORTCUTS["toggle_theme"], "toggle_theme"),)),
+    ("&Tools", (("&Batch Convert DOIs", None, "batch_convert"),)),
+    ("&Help", (("&About", None, "show_about"),)),
+)
+
+
+class SaveThread(QThread):
+    """Write storage to disk without blocking the window"""
+
+    saved = pyqtSignal(str)  # 실패 시 오류 메시지, 성공하면 빈 문자열
+
+    def __init__(self, storage, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+
+    def run(self):
+        try:
+            self.storage.save_all()
+            self.saved.emit("")
+        except Exception as e:
+            self.saved.emit(str(e))
+
 
 class MainWindow(QMainWindow):
     def __init__(self, storage):
         super().__init__()
         self.storage = storage
         self.current_theme = "light"
+        self.save_thread = None
+        self.close_saved = False
+        self.project_dialog = None
+        # 일괄 변환 결과는 나눠서 오므로 이번 일괄 변환에서 추가한 수를 누적
+        self.batch_added_count = 0
 
         # Initialize managers
-        self.doi_converter = DOIConverter()
         self.project_manager = ProjectManager(storage)
         self.paper_manager = PaperManager(storage)
         self.theme_manager = ThemeManager()
 
+        # Apply theme before the widgets are created so they are styled once
+        self.theme_manager.apply_theme(self, self.current_theme)
+
         # Setup UI
         self.setup_ui()
         self.setup_menus()
-        self.setup_shortcuts()
         self.setup_statusbar()
 
         # Connect signals
         self.connect_signals()
 
-        # Load data
-        self.load_initial_data()
-
-        # Apply theme
-        self.theme_manager.apply_theme(self, self.current_theme)
+        # Load data after the window has been shown and painted
+        QTimer.singleShot(0, self.load_initial_data)
 
     def setup_ui(self):
         """Setup the main UI layout"""
@@ -95,76 +144,19 @@ class MainWindow(QMainWindow):
         """Setup menu bar (중복 기능 정리됨)"""
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("&File")
-
-        new_project_action = QAction("&New Project", self)
-        new_project_action.setShortcut(QKeySequence(SHORTCUTS["new_project"]))
-        new_project_action.triggered.connect(self.new_project)
-        file_menu.addAction(new_project_action)
-
-        file_menu.addSeparator()
+        for menu_title, entries in MENU_LAYOUT:
+            menu = menubar.addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
 
-        import_action = QAction("&Import...", self)
-        import_action.setShortcut(QKeySequence(SHORTCUTS["import"]))
-        import_action.triggered.connect(self.import_data)
-        file_menu.addAction(import_action)
-
-        export_action = QAction("&Export...", self)
-        export_action.setShortcut(QKeySequence(SHORTCUTS["export"]))
-        export_action.triggered.connect(self.export_data)
-        file_menu.addAction(export_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Edit menu
-        edit_menu = menubar.addMenu("&Edit")
-
-        search_action = QAction("&Search", self)
-        search_action.setShortcut(QKeySequence(SHORTCUTS["search"]))
-        search_action.triggered.connect(self.focus_search)
-        edit_menu.addAction(search_action)
-
-        paste_doi_action = QAction("&Paste DOI and Convert", self)
-        paste_doi_action.setShortcut(QKeySequence(SHORTCUTS["paste_doi"]))
-        paste_doi_action.triggered.connect(self.paste_and_convert_doi)
-        edit_menu.addAction(paste_doi_action)
-
-        # View menu
-        view_menu = menubar.addMenu("&View")
-
-        toggle_theme_action = QAction("Toggle &Theme", self)
-        toggle_theme_action.setShortcut(QKeySequence(SHORTCUTS["toggle_theme"]))
-        toggle_theme_action.triggered.connect(self.toggle_theme)
-        view_menu.addAction(toggle_theme_action)
-
-        # Tools menu
-        tools_menu = menubar.addMenu("&Tools")
-
-        batch_convert_action = QAction("&Batch Convert DOIs", self)
-        batch_convert_action.triggered.connect(self.batch_convert)
-        tools_menu.addAction(batch_convert_action)
-
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
-
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
-
-    def setup_shortcuts(self):
-        """Setup keyboard shortcuts"""
-        # Paste and convert DOI shortcut
-        paste_shortcut = QKeySequence(SHORTCUTS["paste_doi"])
-        paste_action = QAction(self)
-        paste_action.setShortcut(paste_shortcut)
-        paste_action.triggered.connect(self.paste_and_convert_doi)
-        self.addAction(paste_action)
+                text, shortcut, slot_name = entry
+                action = QAction(text, self)
+                if shortcut is not None:
+                    action.setShortcut(QKeySequence(shortcut))
+                action.triggered.connect(getattr(self, slot_name))
+                menu.addAction(action)
 
     def setup_statusbar(self):
         """Setup status bar"""
@@ -177,6 +169,7 @@ class MainWindow(QMainWindow):
         # DOI input signals
         self.doi_input.doi_converted.connect(self.on_doi_converted)
         self.doi_input.batch_converted.connect(self.on_batch_converted)
+        self.doi_input.batch_started.connect(self.on_batch_started)
 
         # Project tree signals
         self.project_tree.project_selected.connect(self.on_project_selected)
@@ -192,6 +185,7 @@ class MainWindow(QMainWindow):
         self.project_tree.load_projects(projects)
 
     # Slot methods
+    @pyqtSlot(dict)
     def on_doi_converted(self, paper_data):
         """Handle single DOI conversion"""
         if self.project_tree.current_project:
@@ -201,7 +195,7 @@ class MainWindow(QMainWindow):
                 added_paper = self.paper_manager.add_paper_to_project(
                     project_id, paper_data
                 )
-                self.project_tree.refresh_current_project()
+                self.project_tree.add_paper_to_tree(project_id, added_paper)
                 self.detail_panel.display_paper(added_paper)
 
                 title = paper_data.get("title", "Unknown Title")[:50]
@@ -215,71 +209,89 @@ class MainWindow(QMainWindow):
             # Show dialog to select project or create new one
             self.show_project_selection_dialog(paper_data)
 
+    @pyqtSlot()
+    def on_batch_started(self):
+        """Reset the added-paper count for a new batch"""
+        self.batch_added_count = 0
+
+    @pyqtSlot(list)
     def on_batch_converted(self, papers_data):
         """Handle batch DOI conversion"""
         if self.project_tree.current_project:
             project_id = self.project_tree.current_project
-            for paper_data in papers_data:
-                self.paper_manager.add_paper_to_project(project_id, paper_data)
-            self.project_tree.refresh_current_project()
-            self.status_bar.showMessage(f"Added {len(papers_data)} papers")
+            added_papers = self.paper_manager.add_papers_to_project(
+                project_id, papers_data
+            )
+            self.project_tree.add_papers_to_tree(project_id, added_papers)
+            self.batch_added_count += len(papers_data)
+            self.status_bar.showMessage(f"Added {self.batch_added_count} papers")
         else:
             self.status_bar.showMessage("Please select a project first")
 
+    @pyqtSlot(str)
     def on_project_selected(self, project_id):
         """Handle project selection"""
         papers = self.paper_manager.get_papers_in_project(project_id)
         self.detail_panel.display_project_papers(papers)
 
+    @pyqtSlot(dict)
     def on_paper_selected(self, paper_data):
         """Handle paper selection"""
         self.detail_panel.display_paper(paper_data)
 
+    @pyqtSlot(str)
     def on_search_requested(self, query):
         """Handle search request"""
         results = self.paper_manager.search_papers(query)
         self.detail_panel.display_search_results(results)
 
+    @pyqtSlot(dict)
     def on_filter_changed(self, filters):
         """Handle filter changes"""
         # Apply filters to current view
         pass
 
     # Action methods
+    @pyqtSlot()
     def new_project(self):
         """Create new project"""
         self.project_tree.create_new_project()
 
+    @pyqtSlot()
     def import_data(self):
         """Import data from file"""
         QMessageBox.information(self, "Import", "Import functionality coming soon!")
 
+    @pyqtSlot()
     def export_data(self):
         """Export data to file"""
         QMessageBox.information(self, "Export", "Export functionality coming soon!")
 
+    @pyqtSlot()
     def batch_convert(self):
         """Open batch convert dialog"""
         self.doi_input.show_batch_dialog()
 
+    @pyqtSlot()
     def focus_search(self):
         """Focus search bar"""
         self.search_bar.focus_search()
 
+    @pyqtSlot()
     def paste_and_convert_doi(self):
         """Paste DOI from clipboard and convert"""
         self.doi_input.paste_and_convert()
 
+    @pyqtSlot()
     def toggle_theme(self):
         """Toggle between light and dark theme"""
         self.current_theme = "dark" if self.current_theme == "light" else "light"
         self.theme_manager.apply_theme(self, self.current_theme)
         self.status_bar.showMessage(f"Switched to {self.current_theme} theme")
 
-    def show_project_selection_dialog(self, paper_data):
-        """Show dialog to select project for new paper"""
+    def build_project_selection_dialog(self):
+        """Build the project selection dialog once; it is reused for every paper"""
         from PyQt6.QtWidgets import (
-            QDialog,
             QVBoxLayout,
             QHBoxLayout,
             QLabel,
@@ -296,34 +308,21 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(dialog)
 
         # Paper info
-        title = paper_data.get("title", "Unknown Title")
-        info_label = QLabel(
-            f"Add paper to project:\n{title[:60]}{'...' if len(title) > 60 else ''}"
-        )
-        info_label.setWordWrap(True)
-        layout.addWidget(info_label)
+        self.project_dialog_info = QLabel()
+        self.project_dialog_info.setWordWrap(True)
+        layout.addWidget(self.project_dialog_info)
 
         # Project selection
         project_layout = QHBoxLayout()
         project_layout.addWidget(QLabel("Project:"))
 
-        project_combo = QComboBox()
-        projects = self.project_manager.get_all_projects()
-
-        if not projects:
-            # No projects exist, create default one
-            default_project = self.project_manager.create_project("My Papers")
-            projects = [default_project]
-
-        for project in projects:
-            project_combo.addItem(project["name"], project["id"])
-
-        project_layout.addWidget(project_combo)
+        self.project_dialog_combo = QComboBox()
+        project_layout.addWidget(self.project_dialog_combo)
 
         # New project button
         new_project_btn = QPushButton("New Project")
         new_project_btn.clicked.connect(
-            lambda: self.create_project_from_dialog(dialog, project_combo)
+            lambda: self.create_project_from_dialog(dialog, self.project_dialog_combo)
         )
         project_layout.addWidget(new_project_btn)
 
@@ -337,6 +336,32 @@ class MainWindow(QMainWindow):
         buttons.rejected.connect(dialog.reject)
         layout.addWidget(buttons)
 
+        self.project_dialog = dialog
+
+    def show_project_selection_dialog(self, paper_data):
+        """Show dialog to select project for new paper"""
+        if self.project_dialog is None:
+            self.build_project_selection_dialog()
+        dialog = self.project_dialog
+        project_combo = self.project_dialog_combo
+
+        title = paper_data.get("title", "Unknown Title")
+        self.project_dialog_info.setText(
+            f"Add paper to project:\n{title[:60]}{'...' if len(title) > 60 else ''}"
+        )
+
+        projects = self.project_manager.get_all_projects()
+
+        if not projects:
+            # No projects exist, create default one
+            default_project = self.project_manager.create_project("My Papers")
+            self.project_tree.add_project_to_tree(default_project)
+            projects = [default_project]
+
+        project_combo.clear()
+        for project in projects:
+            project_combo.addItem(project["name"], project["id"])
+
         if dialog.exec() == QDialog.DialogCode.Accepted:
             selected_project_id = project_combo.currentData()
             if selected_project_id:
@@ -344,8 +369,8 @@ class MainWindow(QMainWindow):
                     added_paper = self.paper_manager.add_paper_to_project(
                         selected_project_id, paper_data
                     )
-                    self.project_tree.load_projects(
-                        self.project_manager.get_all_projects()
+                    self.project_tree.add_paper_to_tree(
+                        selected_project_id, added_paper
                     )
                     self.detail_panel.display_paper(added_paper)
 
@@ -365,6 +390,7 @@ class MainWindow(QMainWindow):
         if ok and name.strip():
             try:
                 new_project = self.project_manager.create_project(name.strip())
+                self.project_tree.add_project_to_tree(new_project)
                 combo.addItem(new_project["name"], new_project["id"])
                 combo.setCurrentIndex(combo.count() - 1)
             except Exception as e:
@@ -372,6 +398,7 @@ class MainWindow(QMainWindow):
                     dialog, "Error", f"Failed to create project:\n{str(e)}"
                 )
 
+    @pyqtSlot()
     def show_about(self):
         """Show about dialog"""
         QMessageBox.about(
@@ -384,18 +411,43 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close event"""
-        # Save any unsaved data
-        try:
-            self.storage.save_all()
+        # 디바운스 중인 메모를 먼저 storage에 반영
+        self.detail_panel.flush_pending_notes()
+        if self.close_saved:
             event.accept()
-        except Exception as e:
+            return
+
+        # Save any unsaved data in the background and close once it is written
+        event.ignore()
+        if self.save_thread is not None and self.save_thread.isRunning():
+            return
+
+        self.centralWidget().setEnabled(False)
+        self.menuBar().setEnabled(False)
+        self.status_bar.showMessage("Saving...")
+        # 저장 중 끝난 변환이 storage를 바꾸지 않도록 doi_converted 차단
+        self.doi_input.blockSignals(True)
+
+        self.save_thread = SaveThread(self.storage, self)
+        self.save_thread.saved.connect(self.on_close_saved)
+        self.save_thread.start()
+
+    @pyqtSlot(str)
+    def on_close_saved(self, error):
+        """Finish closing after the background save"""
+        if error:
             reply = QMessageBox.question(
                 self,
                 "Error Saving",
-                f"Error saving data: {e}\n\nExit anyway?",
+                f"Error saving data: {error}\n\nExit anyway?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             )
-            if reply == QMessageBox.StandardButton.Yes:
-                event.accept()
-            else:
-                event.ignore()
+            if reply != QMessageBox.StandardButton.Yes:
+                self.centralWidget().setEnabled(True)
+                self.menuBar().setEnabled(True)
+                self.doi_input.blockSignals(False)
+                self.status_bar.clearMessage()
+                return
+
+        self.close_saved = True
+        self.close()
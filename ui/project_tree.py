@@ -2,12 +2,14 @@
 Project Tree Widget for DOI Citation Manager
 """
 
+from contextlib import contextmanager
+from enum import IntEnum
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QPushButton,
     QInputDialog,
     QMessageBox,
@@ -17,11 +19,295 @@ from PyQt6.QtWidgets import (
     QDialog,
     QFormLayout,
     QDialogButtonBox,
+    QApplication,
+    QStyle,
+)
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    pyqtSlot,
+    QAbstractItemModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QPoint,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QIcon, QAction
 
 
+@contextmanager
+def suspended_updates(tree):
+    """Suspend repaint and signals of tree while its items are rebuilt"""
+    tree.setUpdatesEnabled(False)
+    blocked = tree.blockSignals(True)
+    try:
+        yield
+    finally:
+        tree.blockSignals(blocked)
+        tree.setUpdatesEnabled(True)
+
+
+def paper_label(paper):
+    """Return the tree label for a paper, truncating long titles"""
+    title = paper.get("title") or "Unknown Title"
+    if len(title) > 50:
+        return f"{title[:50]}..."
+    return title
+
+
+class TreeIcons:
+    """Project and paper icons, created once and shared by every row"""
+
+    _project = None
+    _paper = None
+
+    @classmethod
+    def project(cls):
+        if cls._project is None:
+            cls._project = QApplication.style().standardIcon(
+                QStyle.StandardPixmap.SP_DirIcon
+            )
+        return cls._project
+
+    @classmethod
+    def paper(cls):
+        if cls._paper is None:
+            cls._paper = QApplication.style().standardIcon(
+                QStyle.StandardPixmap.SP_FileIcon
+            )
+        return cls._paper
+
+
+class NodeKind(IntEnum):
+    """Kind of row in the project tree"""
+
+    PROJECT = 1
+    PAPER = 2
+
+
+# 항목의 TreeNode를 돌려주는 role
+NODE_ROLE = Qt.ItemDataRole.UserRole
+
+
+class TreeNode:
+    """Project or paper row in ProjectTreeModel"""
+
+    __slots__ = ("kind", "id", "data", "label", "row", "papers", "project")
+
+    def __init__(self, kind, node_id, data, label, project=None):
+        self.kind = kind
+        self.id = node_id
+        self.data = data
+        self.label = label
+        self.row = 0
+        # 프로젝트: 논문 노드 목록 (fetchMore 전에는 None)
+        self.papers = None
+        # 논문: 소속 프로젝트 노드
+        self.project = project
+
+
+class ProjectTreeModel(QAbstractItemModel):
+    """Two-level model of projects and the papers in each project"""
+
+    def __init__(self, load_papers, parent=None):
+        super().__init__(parent)
+        self.load_papers = load_papers
+        self._projects = []
+        self._project_nodes = {}  # project_id -> project node
+
+    @staticmethod
+    def make_paper_node(paper, project_node):
+        return TreeNode(
+            NodeKind.PAPER, paper.get("id"), paper, paper_label(paper), project_node
+        )
+
+    @staticmethod
+    def make_project_node(project):
+        return TreeNode(NodeKind.PROJECT, project["id"], project, project["name"])
+
+    def project_index(self, project_node):
+        return self.createIndex(project_node.row, 0, project_node)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column, self._projects[row])
+        return self.createIndex(row, column, parent.internalPointer().papers[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+
+        node = index.internalPointer()
+        if node.kind == NodeKind.PROJECT:
+            return QModelIndex()
+        return self.project_index(node.project)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return len(self._projects)
+
+        node = parent.internalPointer()
+        if node.kind == NodeKind.PROJECT and node.papers is not None:
+            return len(node.papers)
+        return 0
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self._projects)
+
+        node = parent.internalPointer()
+        if node.kind != NodeKind.PROJECT:
+            return False
+        if node.papers is None:
+            # 로드 전에는 프로젝트의 논문 ID 목록으로 펼침 표시 여부를 결정
+            return bool(node.data.get("papers"))
+        return bool(node.papers)
+
+    def canFetchMore(self, parent):
+        if not parent.isValid():
+            return False
+
+        node = parent.internalPointer()
+        return node.kind == NodeKind.PROJECT and node.papers is None
+
+    def fetchMore(self, parent):
+        """Load a project's papers the first time it is expanded"""
+        if not self.canFetchMore(parent):
+            return
+
+        node = parent.internalPointer()
+        papers = self.load_papers(node.id)
+        node.papers = []
+        if papers:
+            self.beginInsertRows(parent, 0, len(papers) - 1)
+            node.papers = [self.make_paper_node(paper, node) for paper in papers]
+            self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.label
+        if role == Qt.ItemDataRole.DecorationRole:
+            if node.kind == NodeKind.PROJECT:
+                return TreeIcons.project()
+            return TreeIcons.paper()
+        if role == NODE_ROLE:
+            return node
+        return None
+
+    def set_projects(self, projects):
+        """Replace all projects; papers are loaded on first expand"""
+        self.beginResetModel()
+        self._projects = [self.make_project_node(project) for project in projects]
+        self._project_nodes = {node.id: node for node in self._projects}
+        for row, node in enumerate(self._projects):
+            node.row = row
+        self.endResetModel()
+
+    def add_project(self, project):
+        """Append a project and return its index"""
+        row = len(self._projects)
+        self.beginInsertRows(QModelIndex(), row, row)
+        node = self.make_project_node(project)
+        node.row = row
+        self._projects.append(node)
+        self._project_nodes[node.id] = node
+        self.endInsertRows()
+        return self.project_index(node)
+
+    def remove_project(self, row):
+        """Remove the project at row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        node = self._projects.pop(row)
+        self._project_nodes.pop(node.id, None)
+        for later_row in range(row, len(self._projects)):
+            self._projects[later_row].row = later_row
+        self.endRemoveRows()
+
+    def rename_project(self, index, name):
+        """Update a project's name and label"""
+        node = index.internalPointer()
+        node.data["name"] = name
+        node.label = name
+        self.dataChanged.emit(index, index)
+
+    def set_papers(self, project_index, papers):
+        """Replace the papers under a loaded project"""
+        node = project_index.internalPointer()
+        if node.papers is None:
+            return
+
+        if node.papers:
+            self.beginRemoveRows(project_index, 0, len(node.papers) - 1)
+            node.papers = []
+            self.endRemoveRows()
+
+        if papers:
+            self.beginInsertRows(project_index, 0, len(papers) - 1)
+            node.papers = [self.make_paper_node(paper, node) for paper in papers]
+            self.endInsertRows()
+
+    def append_papers(self, project_index, papers):
+        """Add paper rows at the end of a project, skipping ones already shown"""
+        node = project_index.internalPointer()
+        if node.papers is None:
+            # 아직 로드되지 않은 프로젝트는 펼칠 때 새 논문까지 함께 불러옴
+            self.dataChanged.emit(project_index, project_index)
+            return
+
+        shown_ids = {paper_node.id for paper_node in node.papers}
+        new_nodes = []
+        for paper in papers:
+            paper_id = paper.get("id")
+            if paper_id not in shown_ids:
+                shown_ids.add(paper_id)
+                new_nodes.append(self.make_paper_node(paper, node))
+
+        if not new_nodes:
+            return
+
+        first_row = len(node.papers)
+        self.beginInsertRows(project_index, first_row, first_row + len(new_nodes) - 1)
+        node.papers.extend(new_nodes)
+        self.endInsertRows()
+
+    def remove_paper(self, index):
+        """Remove a paper row from its project"""
+        project_node = index.internalPointer().project
+        row = index.row()
+        self.beginRemoveRows(self.project_index(project_node), row, row)
+        del project_node.papers[row]
+        self.endRemoveRows()
+
+    def find_project(self, project_id):
+        """Return the index of the project with project_id"""
+        node = self._project_nodes.get(project_id)
+        if node is None:
+            return QModelIndex()
+        return self.project_index(node)
+
+    @staticmethod
+    def project_paper_count(node):
+        """Number of papers in a project node, loaded or not"""
+        if node.papers is None:
+            return len(node.data.get("papers", []))
+        return len(node.papers)
+
+    def paper_count(self):
+        """Total number of papers across projects"""
+        return sum(self.project_paper_count(node) for node in self._projects)
+
+
 class NewProjectDialog(QDialog):
     """Dialog for creating new project"""
 
@@ -75,7 +361,9 @@ class ProjectTreeWidget(QWidget):
         super().__init__()
         self.project_manager = project_manager
         self.current_project = None
+        self.confirm_box = None
         self.setup_ui()
+        self.setup_context_menus()
         self.connect_signals()
 
     def setup_ui(self):
@@ -99,11 +387,15 @@ class ProjectTreeWidget(QWidget):
 
         layout.addLayout(header_layout)
 
-        # Tree widget
-        self.tree = QTreeWidget()
+        # Tree view
+        self.model = ProjectTreeModel(self.project_manager.get_papers_in_project, self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
         self.tree.setHeaderHidden(True)
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree.setAlternatingRowColors(True)
+        # 모든 행 높이가 같으므로 Qt가 행마다 크기를 계산하지 않게 함
+        self.tree.setUniformRowHeights(True)
         layout.addWidget(self.tree)
 
         # Stats label
@@ -115,158 +407,166 @@ class ProjectTreeWidget(QWidget):
         """Connect widget signals"""
         self.new_btn.clicked.connect(self.create_new_project)
 
-        self.tree.itemSelectionChanged.connect(self.on_selection_changed)
-        self.tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.tree.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.tree.doubleClicked.connect(self.on_item_double_clicked)
         self.tree.customContextMenuRequested.connect(self.show_context_menu)
-        self.tree.itemExpanded.connect(self.on_item_expanded)
 
     def load_projects(self, projects):
         """Load projects into tree"""
-        self.tree.clear()
-
-        for project in projects:
-            project_item = QTreeWidgetItem(self.tree)
-            project_item.setText(0, f"📁 {project['name']}")
-            project_item.setData(
-                0,
-                Qt.ItemDataRole.UserRole,
-                {"type": "project", "id": project["id"], "data": project},
-            )
-
-            # Load papers in project
-            papers = self.project_manager.get_papers_in_project(project["id"])
-            for paper in papers:
-                paper_item = QTreeWidgetItem(project_item)
-                title = paper.get("title", "Unknown Title")[:50]
-                if len(paper.get("title", "")) > 50:
-                    title += "..."
-                paper_item.setText(0, f"📄 {title}")
-                paper_item.setData(
-                    0,
-                    Qt.ItemDataRole.UserRole,
-                    {"type": "paper", "id": paper.get("id"), "data": paper},
-                )
-
-            # Set project item expanded by default if it has papers
-            if papers:
-                project_item.setExpanded(True)
+        # 프로젝트 행만 만들고 논문은 사용자가 펼칠 때 모델이 불러옴
+        with suspended_updates(self.tree):
+            self.model.set_projects(projects)
 
         self.update_stats()
 
-    def on_item_expanded(self, item):
-        """Handle item expansion"""
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
-        if item_data and item_data["type"] == "project":
-            # Refresh papers when project is expanded
-            self.refresh_project_papers(item, item_data["id"])
-
-    def refresh_project_papers(self, project_item, project_id):
+    def refresh_project_papers(self, project_index, project_id):
         """Refresh papers for a specific project item"""
-        # Clear existing children
-        project_item.takeChildren()
-
-        # Reload papers
-        papers = self.project_manager.get_papers_in_project(project_id)
-        for paper in papers:
-            paper_item = QTreeWidgetItem(project_item)
-            title = paper.get("title", "Unknown Title")[:50]
-            if len(paper.get("title", "")) > 50:
-                title += "..."
-            paper_item.setText(0, f"📄 {title}")
-            paper_item.setData(
-                0,
-                Qt.ItemDataRole.UserRole,
-                {"type": "paper", "id": paper.get("id"), "data": paper},
-            )
+        with suspended_updates(self.tree):
+            papers = self.project_manager.get_papers_in_project(project_id)
+            self.model.set_papers(project_index, papers)
 
     def update_stats(self):
         """Update statistics label"""
-        project_count = self.tree.topLevelItemCount()
-        total_papers = 0
-
-        for i in range(project_count):
-            project_item = self.tree.topLevelItem(i)
-            papers = self.project_manager.get_papers_in_project(
-                project_item.data(0, Qt.ItemDataRole.UserRole)["id"]
-            )
-            total_papers += len(papers)
+        project_count = self.model.rowCount()
+        # 모델에 이미 있는 논문 수를 세고 저장소는 다시 조회하지 않음
+        total_papers = self.model.paper_count()
 
         self.stats_label.setText(f"{project_count} projects, {total_papers} papers")
 
+    @pyqtSlot()
     def on_selection_changed(self):
         """Handle tree selection change"""
-        selected_items = self.tree.selectedItems()
-        if not selected_items:
+        selected_indexes = self.tree.selectionModel().selectedIndexes()
+        if not selected_indexes:
             return
 
-        item = selected_items[0]
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item_data = selected_indexes[0].internalPointer()
 
-        if item_data["type"] == "project":
-            self.current_project = item_data["id"]
-            self.project_selected.emit(item_data["id"])
+        if item_data.kind == NodeKind.PROJECT:
+            self.current_project = item_data.id
+            self.project_selected.emit(item_data.id)
 
-        elif item_data["type"] == "paper":
+        elif item_data.kind == NodeKind.PAPER:
             # Get parent project
-            parent_item = item.parent()
-            if parent_item:
-                parent_data = parent_item.data(0, Qt.ItemDataRole.UserRole)
-                self.current_project = parent_data["id"]
+            self.current_project = item_data.project.id
 
-            self.paper_selected.emit(item_data["data"])
+            self.paper_selected.emit(item_data.data)
 
-    def on_item_double_clicked(self, item, column):
+    @pyqtSlot(QModelIndex)
+    def on_item_double_clicked(self, index):
         """Handle item double click"""
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item_data = index.internalPointer()
 
-        if item_data["type"] == "project":
+        if item_data.kind == NodeKind.PROJECT:
             # Toggle expand/collapse
-            item.setExpanded(not item.isExpanded())
-        elif item_data["type"] == "paper":
+            self.tree.setExpanded(index, not self.tree.isExpanded(index))
+        elif item_data.kind == NodeKind.PAPER:
             # Show paper details
-            self.paper_selected.emit(item_data["data"])
+            self.paper_selected.emit(item_data.data)
 
-    def show_context_menu(self, position):
-        """Show context menu"""
-        item = self.tree.itemAt(position)
-        if not item:
-            return
+    def setup_context_menus(self):
+        """Build the project and paper context menus once"""
+        # 메뉴를 열 때마다 QAction을 만들지 않고 대상 항목만 바꿔 재사용
+        self.context_index = QPersistentModelIndex()
 
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
-        menu = QMenu(self)
+        self.project_menu = QMenu(self)
 
-        if item_data["type"] == "project":
-            rename_action = QAction("Rename Project", self)
-            rename_action.triggered.connect(lambda: self.rename_project(item))
-            menu.addAction(rename_action)
+        rename_action = QAction("Rename Project", self)
+        rename_action.triggered.connect(self.on_rename_triggered)
+        self.project_menu.addAction(rename_action)
 
-            delete_action = QAction("Delete Project", self)
-            delete_action.triggered.connect(lambda: self.delete_project(item))
-            menu.addAction(delete_action)
+        delete_action = QAction("Delete Project", self)
+        delete_action.triggered.connect(self.on_delete_triggered)
+        self.project_menu.addAction(delete_action)
 
-            menu.addSeparator()
+        self.project_menu.addSeparator()
 
-            expand_action = QAction("Expand All", self)
-            expand_action.triggered.connect(lambda: item.setExpanded(True))
-            menu.addAction(expand_action)
+        expand_action = QAction("Expand All", self)
+        expand_action.triggered.connect(self.on_expand_triggered)
+        self.project_menu.addAction(expand_action)
 
-            collapse_action = QAction("Collapse All", self)
-            collapse_action.triggered.connect(lambda: item.setExpanded(False))
-            menu.addAction(collapse_action)
+        collapse_action = QAction("Collapse All", self)
+        collapse_action.triggered.connect(self.on_collapse_triggered)
+        self.project_menu.addAction(collapse_action)
 
-        elif item_data["type"] == "paper":
-            view_action = QAction("View Details", self)
-            view_action.triggered.connect(
-                lambda: self.paper_selected.emit(item_data["data"])
-            )
-            menu.addAction(view_action)
+        self.paper_menu = QMenu(self)
 
-            remove_action = QAction("Remove from Project", self)
-            remove_action.triggered.connect(lambda: self.remove_paper(item))
-            menu.addAction(remove_action)
+        view_action = QAction("View Details", self)
+        view_action.triggered.connect(self.on_view_triggered)
+        self.paper_menu.addAction(view_action)
 
-        menu.exec(self.tree.mapToGlobal(position))
+        remove_action = QAction("Remove from Project", self)
+        remove_action.triggered.connect(self.on_remove_triggered)
+        self.paper_menu.addAction(remove_action)
 
+    @pyqtSlot(QPoint)
+    def show_context_menu(self, position):
+        """Show context menu"""
+        item = self.tree.indexAt(position)
+        if not item.isValid():
+            return
+
+        item_data = item.internalPointer()
+        self.context_index = QPersistentModelIndex(item)
+
+        if item_data.kind == NodeKind.PROJECT:
+            self.project_menu.exec(self.tree.mapToGlobal(position))
+        elif item_data.kind == NodeKind.PAPER:
+            self.paper_menu.exec(self.tree.mapToGlobal(position))
+
+    def context_item(self):
+        """Index of the item the context menu was opened on"""
+        return QModelIndex(self.context_index)
+
+    @pyqtSlot()
+    def on_rename_triggered(self):
+        if self.context_index.isValid():
+            self.rename_project(self.context_item())
+
+    @pyqtSlot()
+    def on_delete_triggered(self):
+        if self.context_index.isValid():
+            self.delete_project(self.context_item())
+
+    @pyqtSlot()
+    def on_expand_triggered(self):
+        if self.context_index.isValid():
+            self.tree.expandRecursively(self.context_item())
+
+    @pyqtSlot()
+    def on_collapse_triggered(self):
+        if self.context_index.isValid():
+            self.tree.collapse(self.context_item())
+
+    @pyqtSlot()
+    def on_view_triggered(self):
+        if self.context_index.isValid():
+            item_data = self.context_index.internalPointer()
+            self.paper_selected.emit(item_data.data)
+
+    @pyqtSlot()
+    def on_remove_triggered(self):
+        if self.context_index.isValid():
+            self.remove_paper(self.context_item())
+
+    def confirm(self, title, text):
+        """Ask a yes/no question using one reused message box"""
+        if self.confirm_box is None:
+            self.confirm_box = QMessageBox(self)
+            self.confirm_box.setIcon(QMessageBox.Icon.Question)
+            self.confirm_box.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+
+        self.confirm_box.setWindowTitle(title)
+        self.confirm_box.setText(text)
+        self.confirm_box.exec()
+        clicked = self.confirm_box.clickedButton()
+        return (
+            self.confirm_box.standardButton(clicked) == QMessageBox.StandardButton.Yes
+        )
+
+    @pyqtSlot()
     def create_new_project(self):
         """Create new project"""
         dialog = NewProjectDialog(self)
@@ -284,22 +584,20 @@ class ProjectTreeWidget(QWidget):
 
     def rename_project(self, item):
         """Rename selected project"""
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item_data = item.internalPointer()
 
-        if item_data["type"] != "project":
+        if item_data.kind != NodeKind.PROJECT:
             return
 
-        current_name = item_data["data"]["name"]
+        current_name = item_data.data["name"]
         new_name, ok = QInputDialog.getText(
             self, "Rename Project", "Enter new name:", text=current_name
         )
 
         if ok and new_name.strip() and new_name.strip() != current_name:
             try:
-                self.project_manager.rename_project(item_data["id"], new_name.strip())
-                item.setText(0, f"📁 {new_name.strip()}")
-                item_data["data"]["name"] = new_name.strip()
-                item.setData(0, Qt.ItemDataRole.UserRole, item_data)
+                self.project_manager.rename_project(item_data.id, new_name.strip())
+                self.model.rename_project(item, new_name.strip())
             except Exception as e:
                 QMessageBox.critical(
                     self, "Error", f"Failed to rename project:\n{str(e)}"
@@ -307,25 +605,21 @@ class ProjectTreeWidget(QWidget):
 
     def delete_project(self, item):
         """Delete selected project"""
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item_data = item.internalPointer()
 
-        if item_data["type"] != "project":
+        if item_data.kind != NodeKind.PROJECT:
             return
 
-        project_name = item_data["data"]["name"]
-        paper_count = item.childCount()
+        project_name = item_data.data["name"]
+        paper_count = self.model.project_paper_count(item_data)
 
-        reply = QMessageBox.question(
-            self,
+        if self.confirm(
             "Delete Project",
             f"Delete project '{project_name}' and its {paper_count} papers?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
-
-        if reply == QMessageBox.StandardButton.Yes:
+        ):
             try:
-                self.project_manager.delete_project(item_data["id"])
-                self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+                self.project_manager.delete_project(item_data.id)
+                self.model.remove_project(item.row())
                 self.update_stats()
             except Exception as e:
                 QMessageBox.critical(
@@ -334,23 +628,20 @@ class ProjectTreeWidget(QWidget):
 
     def remove_paper(self, paper_item):
         """Remove paper from project"""
-        paper_data = paper_item.data(0, Qt.ItemDataRole.UserRole)
-        project_item = paper_item.parent()
-
-        reply = QMessageBox.question(
-            self,
-            "Remove Paper",
-            "Remove this paper from the project?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-        )
+        paper_data = paper_item.internalPointer()
 
-        if reply == QMessageBox.StandardButton.Yes:
+        # Shift를 누른 채 제거하면 확인 없이 바로 제거
+        skip_confirm = (
+            QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier
+        )
+        if skip_confirm or self.confirm(
+            "Remove Paper", "Remove this paper from the project?"
+        ):
             try:
-                project_data = project_item.data(0, Qt.ItemDataRole.UserRole)
                 self.project_manager.remove_paper_from_project(
-                    project_data["id"], paper_data["id"]
+                    paper_data.project.id, paper_data.id
                 )
-                project_item.removeChild(paper_item)
+                self.model.remove_paper(paper_item)
                 self.update_stats()
             except Exception as e:
                 QMessageBox.critical(
@@ -359,13 +650,19 @@ class ProjectTreeWidget(QWidget):
 
     def add_project_to_tree(self, project):
         """Add new project to tree"""
-        project_item = QTreeWidgetItem(self.tree)
-        project_item.setText(0, f"📁 {project['name']}")
-        project_item.setData(
-            0,
-            Qt.ItemDataRole.UserRole,
-            {"type": "project", "id": project["id"], "data": project},
-        )
+        self.model.add_project(project)
+
+    def add_paper_to_tree(self, project_id, paper):
+        """Add a newly added paper under its project without a full reload"""
+        self.add_papers_to_tree(project_id, [paper])
+
+    def add_papers_to_tree(self, project_id, papers):
+        """Add newly added papers under their project in one insert"""
+        index = self.model.find_project(project_id)
+        if index.isValid():
+            with suspended_updates(self.tree):
+                self.model.append_papers(index, papers)
+            self.update_stats()
 
     def refresh_current_project(self):
         """Refresh papers in current project"""
@@ -373,12 +670,8 @@ class ProjectTreeWidget(QWidget):
             return
 
         # Find project item
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            item_data = item.data(0, Qt.ItemDataRole.UserRole)
-
-            if item_data["id"] == self.current_project:
-                # Refresh papers for this project
-                self.refresh_project_papers(item, self.current_project)
-                self.update_stats()
-                break
+        index = self.model.find_project(self.current_project)
+        if index.isValid():
+            # Refresh papers for this project
+            self.refresh_project_papers(index, self.current_project)
+            self.update_stats()
@@ -2,6 +2,8 @@
 Search Bar Widget for DOI Citation Manager
 """
 
+from types import MappingProxyType
+
 from PyQt6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -12,9 +14,18 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QFrame,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent
 from PyQt6.QtGui import QIcon
 
+# 필터 컨트롤을 만들기 전에 쓰는 기본 필터 값
+DEFAULT_FILTERS = {
+    "search_in": "all",
+    "show_papers": True,
+    "show_projects": True,
+    "tag_filter": "all",
+    "year_filter": "all",
+}
+
 
 class SearchBarWidget(QWidget):
     """Widget for search functionality and filters"""
@@ -24,9 +35,13 @@ class SearchBarWidget(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.search_timer = QTimer()
-        self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self.emit_search)
+        # 마지막으로 보낸 값 (같은 값은 다시 보내지 않음)
+        self.last_query = None
+        self.last_filters = None
+        self.filter_emit_pending = False
+        # IME 조합 중(한글 등)에는 글자마다 검색하지 않음
+        self.composing = False
+        self.composition_pending = False
         self.setup_ui()
         self.connect_signals()
 
@@ -56,116 +71,230 @@ class SearchBarWidget(QWidget):
         self.search_input.setMinimumWidth(300)
         layout.addWidget(self.search_input)
 
+        # 필터 컨트롤은 검색창에 처음 포커스가 갈 때 생성
+        self.filter_layout = layout
+        self.search_in_combo = None
+        self.show_papers_cb = None
+        self.show_projects_cb = None
+        self.tag_filter_combo = None
+        self.year_filter_combo = None
+        self.tag_keys = ["all"]  # 콤보 항목 순서대로의 필터 값
+        self.year_keys = ["all"]
+
+        # Clear filters button
+        self.clear_btn = QPushButton("Clear")
+        self.clear_btn.setMaximumWidth(60)
+        layout.addWidget(self.clear_btn)
+
+        layout.addStretch()
+
+        # 현재 필터 값 (컨트롤이 바뀔 때 해당 키만 갱신)
+        self.filters = dict(DEFAULT_FILTERS)
+
+    def build_advanced_filters(self):
+        """Create the filter controls once, next to the search input"""
+        if self.search_in_combo is not None:
+            return
+
+        layout = self.filter_layout
+        position = layout.indexOf(self.search_input) + 1
+
+        def add(widget):
+            nonlocal position
+            layout.insertWidget(position, widget)
+            position += 1
+            return widget
+
         # Search in dropdown
-        self.search_in_combo = QComboBox()
+        self.search_in_combo = add(QComboBox())
         self.search_in_combo.addItem("All Projects", "all")
         self.search_in_combo.addItem("Current Project", "current")
         self.search_in_combo.addItem("Selected Papers", "selected")
         self.search_in_combo.setMinimumWidth(120)
-        layout.addWidget(self.search_in_combo)
 
         # Filter separator
-        separator1 = QFrame()
+        separator1 = add(QFrame())
         separator1.setFrameShape(QFrame.Shape.VLine)
         separator1.setFrameShadow(QFrame.Shadow.Sunken)
-        layout.addWidget(separator1)
 
         # Filter by type
-        layout.addWidget(QLabel("Show:"))
+        add(QLabel("Show:"))
 
-        self.show_papers_cb = QCheckBox("Papers")
+        self.show_papers_cb = add(QCheckBox("Papers"))
         self.show_papers_cb.setChecked(True)
-        layout.addWidget(self.show_papers_cb)
 
-        self.show_projects_cb = QCheckBox("Projects")
+        self.show_projects_cb = add(QCheckBox("Projects"))
         self.show_projects_cb.setChecked(True)
-        layout.addWidget(self.show_projects_cb)
 
         # Filter separator
-        separator2 = QFrame()
+        separator2 = add(QFrame())
         separator2.setFrameShape(QFrame.Shape.VLine)
         separator2.setFrameShadow(QFrame.Shadow.Sunken)
-        layout.addWidget(separator2)
 
         # Tag filter
-        layout.addWidget(QLabel("Tag:"))
+        add(QLabel("Tag:"))
 
-        self.tag_filter_combo = QComboBox()
-        self.tag_filter_combo.addItem("All Tags", "all")
+        self.tag_filter_combo = add(QComboBox())
+        self.tag_filter_combo.addItem("All Tags")
         self.tag_filter_combo.setMinimumWidth(100)
-        layout.addWidget(self.tag_filter_combo)
 
         # Year filter
-        layout.addWidget(QLabel("Year:"))
+        add(QLabel("Year:"))
 
-        self.year_filter_combo = QComboBox()
-        self.year_filter_combo.addItem("All Years", "all")
+        self.year_filter_combo = add(QComboBox())
+        self.year_filter_combo.addItem("All Years")
         self.year_filter_combo.setMinimumWidth(80)
-        layout.addWidget(self.year_filter_combo)
 
-        # Clear filters button
-        self.clear_btn = QPushButton("Clear")
-        self.clear_btn.setMaximumWidth(60)
-        layout.addWidget(self.clear_btn)
-
-        layout.addStretch()
+        # Filter controls (콤보는 사용자가 고를 때만 반응, 코드에서 바꾸면 직접 갱신)
+        self.search_in_combo.activated.connect(self.on_search_in_changed)
+        self.show_papers_cb.toggled.connect(self.on_show_papers_toggled)
+        self.show_projects_cb.toggled.connect(self.on_show_projects_toggled)
+        self.tag_filter_combo.activated.connect(self.on_tag_filter_changed)
+        self.year_filter_combo.activated.connect(self.on_year_filter_changed)
 
     def connect_signals(self):
         """Connect widget signals"""
-        # Search input with delay
+        # Search input: search when editing is finished (Enter or focus out)
         self.search_input.textChanged.connect(self.on_search_text_changed)
-        self.search_input.returnPressed.connect(self.emit_search)
-
-        # Filter controls
-        self.search_in_combo.currentTextChanged.connect(self.emit_filter_change)
-        self.show_papers_cb.toggled.connect(self.emit_filter_change)
-        self.show_projects_cb.toggled.connect(self.emit_filter_change)
-        self.tag_filter_combo.currentTextChanged.connect(self.emit_filter_change)
-        self.year_filter_combo.currentTextChanged.connect(self.emit_filter_change)
+        self.search_input.returnPressed.connect(self.force_search)
+        self.search_input.editingFinished.connect(self.emit_search)
+        self.search_input.installEventFilter(self)
 
         # Clear button
         self.clear_btn.clicked.connect(self.clear_filters)
 
+    def eventFilter(self, obj, event):
+        """Build filters on first focus and track IME composition"""
+        if obj is self.search_input:
+            event_type = event.type()
+            if event_type == QEvent.Type.FocusIn:
+                self.build_advanced_filters()
+            elif event_type == QEvent.Type.InputMethod:
+                was_composing = self.composing
+                self.composing = bool(event.preeditString())
+                if was_composing and not self.composing and self.composition_pending:
+                    # 조합이 끝나면 미뤄둔 검색을 한 번만 처리
+                    QTimer.singleShot(0, self.flush_composition)
+        return super().eventFilter(obj, event)
+
+    def flush_composition(self):
+        """Handle the text change held back during IME composition"""
+        if self.composing or not self.composition_pending:
+            return
+
+        self.composition_pending = False
+        self.on_search_text_changed(self.search_input.text())
+
     def on_search_text_changed(self, text):
-        """Handle search text change with delay"""
-        # Stop previous timer
-        self.search_timer.stop()
-
-        # Start new timer for delayed search
-        if text.strip():
-            self.search_timer.start(500)  # 500ms delay
-        else:
+        """Handle search text change; only clearing the field searches at once"""
+        if self.composing:
+            self.composition_pending = True
+            return
+
+        self.composition_pending = False
+        if not text.strip():
             self.emit_search()  # Immediate clear
 
-    def emit_search(self):
-        """Emit search signal"""
+    def emit_search(self, force=False):
+        """Emit search signal if the query changed"""
         query = self.search_input.text().strip()
+        if query == self.last_query and not force:
+            return
+
+        self.last_query = query
         self.search_requested.emit(query)
 
+    def force_search(self):
+        """Emit search signal even if the query is unchanged (Enter)"""
+        self.emit_search(force=True)
+
+    def on_search_in_changed(self, index):
+        self.filters["search_in"] = self.search_in_combo.itemData(index)
+        self.emit_filter_change()
+
+    def on_show_papers_toggled(self, checked):
+        self.filters["show_papers"] = checked
+        self.emit_filter_change()
+
+    def on_show_projects_toggled(self, checked):
+        self.filters["show_projects"] = checked
+        self.emit_filter_change()
+
+    def on_tag_filter_changed(self, index):
+        self.filters["tag_filter"] = self.current_key(
+            self.tag_filter_combo, self.tag_keys
+        )
+        self.emit_filter_change()
+
+    def on_year_filter_changed(self, index):
+        self.filters["year_filter"] = self.current_key(
+            self.year_filter_combo, self.year_keys
+        )
+        self.emit_filter_change()
+
     def emit_filter_change(self):
-        """Emit filter change signal"""
-        filters = self.get_current_filters()
-        self.filter_changed.emit(filters)
+        """Schedule one filter change signal for this event-loop turn"""
+        # 같은 이벤트 루프 안에서 여러 필터가 바뀌어도 한 번만 보냄
+        if self.filter_emit_pending:
+            return
+
+        self.filter_emit_pending = True
+        QTimer.singleShot(0, self.flush_filter_change)
+
+    def flush_filter_change(self):
+        """Emit filter change signal if the filters changed"""
+        self.filter_emit_pending = False
+        if self.filters == self.last_filters:
+            return
+
+        self.last_filters = dict(self.filters)
+        self.filter_changed.emit(self.last_filters)
+
+    def sync_filters(self):
+        """Read every filter control into the filters dict"""
+        if self.search_in_combo is None:
+            self.filters.update(DEFAULT_FILTERS)
+            return
+
+        self.filters.update(
+            search_in=self.search_in_combo.currentData(),
+            show_papers=self.show_papers_cb.isChecked(),
+            show_projects=self.show_projects_cb.isChecked(),
+            tag_filter=self.current_key(self.tag_filter_combo, self.tag_keys),
+            year_filter=self.current_key(self.year_filter_combo, self.year_keys),
+        )
 
     def get_current_filters(self):
-        """Get current filter settings"""
-        return {
-            "search_in": self.search_in_combo.currentData(),
-            "show_papers": self.show_papers_cb.isChecked(),
-            "show_projects": self.show_projects_cb.isChecked(),
-            "tag_filter": self.tag_filter_combo.currentData(),
-            "year_filter": self.year_filter_combo.currentData(),
-        }
+        """Get current filter settings (read-only view)"""
+        return MappingProxyType(self.filters)
 
     def clear_filters(self):
         """Clear all filters"""
-        self.search_input.clear()
-        self.search_in_combo.setCurrentIndex(0)
-        self.show_papers_cb.setChecked(True)
-        self.show_projects_cb.setChecked(True)
-        self.tag_filter_combo.setCurrentIndex(0)
-        self.year_filter_combo.setCurrentIndex(0)
-
+        controls = (self.search_input,)
+        if self.search_in_combo is not None:
+            controls += (
+                self.search_in_combo,
+                self.show_papers_cb,
+                self.show_projects_cb,
+                self.tag_filter_combo,
+                self.year_filter_combo,
+            )
+        # 컨트롤마다 시그널이 나가지 않게 막고 마지막에 한 번만 보냄
+        for control in controls:
+            control.blockSignals(True)
+        try:
+            self.search_input.clear()
+            if self.search_in_combo is not None:
+                self.search_in_combo.setCurrentIndex(0)
+                self.show_papers_cb.setChecked(True)
+                self.show_projects_cb.setChecked(True)
+                self.tag_filter_combo.setCurrentIndex(0)
+                self.year_filter_combo.setCurrentIndex(0)
+        finally:
+            for control in controls:
+                control.blockSignals(False)
+
+        self.sync_filters()
         self.emit_search()
         self.emit_filter_change()
 
@@ -174,42 +303,65 @@ class SearchBarWidget(QWidget):
         self.search_input.setFocus()
         self.search_input.selectAll()
 
+    @staticmethod
+    def current_key(combo, keys):
+        """Filter value of the combo's current item"""
+        index = combo.currentIndex()
+        return keys[index] if 0 <= index < len(keys) else None
+
+    def repopulate_combo(self, combo, keys, all_label, labels, values):
+        """Refill a filter combo without per-item signals and return its new keys"""
+        current = self.current_key(combo, keys)
+        new_keys = ["all"] + values
+
+        combo.blockSignals(True)
+        combo.view().setUpdatesEnabled(False)
+        try:
+            # Clear and repopulate
+            combo.clear()
+            combo.addItems([all_label] + labels)
+
+            # Restore selection if possible
+            if current and current != "all" and current in new_keys:
+                combo.setCurrentIndex(new_keys.index(current))
+        finally:
+            combo.view().setUpdatesEnabled(True)
+            combo.blockSignals(False)
+
+        return new_keys
+
     def update_tag_filter(self, available_tags):
         """Update tag filter options"""
-        current_tag = self.tag_filter_combo.currentData()
-
-        # Clear and repopulate
-        self.tag_filter_combo.clear()
-        self.tag_filter_combo.addItem("All Tags", "all")
-
-        for tag in sorted(available_tags):
-            self.tag_filter_combo.addItem(tag, tag)
-
-        # Restore selection if possible
-        if current_tag and current_tag != "all":
-            index = self.tag_filter_combo.findData(current_tag)
-            if index >= 0:
-                self.tag_filter_combo.setCurrentIndex(index)
+        self.build_advanced_filters()
+        tags = sorted(available_tags)
+        self.tag_keys = self.repopulate_combo(
+            self.tag_filter_combo, self.tag_keys, "All Tags", tags, tags
+        )
+        self.filters["tag_filter"] = self.current_key(
+            self.tag_filter_combo, self.tag_keys
+        )
+        self.emit_filter_change()
 
     def update_year_filter(self, available_years):
         """Update year filter options"""
-        current_year = self.year_filter_combo.currentData()
-
-        # Clear and repopulate
-        self.year_filter_combo.clear()
-        self.year_filter_combo.addItem("All Years", "all")
-
-        for year in sorted(available_years, reverse=True):
-            self.year_filter_combo.addItem(str(year), year)
-
-        # Restore selection if possible
-        if current_year and current_year != "all":
-            index = self.year_filter_combo.findData(current_year)
-            if index >= 0:
-                self.year_filter_combo.setCurrentIndex(index)
+        self.build_advanced_filters()
+        years = sorted(available_years, reverse=True)
+        self.year_keys = self.repopulate_combo(
+            self.year_filter_combo,
+            self.year_keys,
+            "All Years",
+            [str(year) for year in years],
+            years,
+        )
+        self.filters["year_filter"] = self.current_key(
+            self.year_filter_combo, self.year_keys
+        )
+        self.emit_filter_change()
 
     def set_search_scope(self, scope):
         """Set search scope programmatically"""
+        self.build_advanced_filters()
         index = self.search_in_combo.findData(scope)
         if index >= 0:
             self.search_in_combo.setCurrentIndex(index)
+            self.on_search_in_changed(index)
@@ -10,43 +10,12 @@ from config import THEMES, RESOURCES_DIR
 import os
 import sys
 import logging
+import re
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-
-class ThemeManager(QObject):
-    """Manager for application themes (배포용 개선)"""
-
-    def __init__(self):
-        super().__init__()
-        self.current_theme = "light"
-        self.ensure_theme_files()
-
-    def ensure_theme_files(self):
-        """테마 파일들이 존재하는지 확인하고 필요시 생성"""
-        try:
-            # 스타일 디렉토리 생성
-            styles_dir = RESOURCES_DIR / "styles"
-            styles_dir.mkdir(parents=True, exist_ok=True)
-
-            # 라이트 테마 파일 생성/확인
-            light_theme_path = styles_dir / "light_theme.qss"
-            if not light_theme_path.exists():
-                self.create_light_theme(light_theme_path)
-
-            # 다크 테마 파일 생성/확인
-            dark_theme_path = styles_dir / "dark_theme.qss"
-            if not dark_theme_path.exists():
-                self.create_dark_theme(dark_theme_path)
-
-            logger.info(f"Theme files ensured in: {styles_dir}")
-
-        except Exception as e:
-            logger.error(f"Error ensuring theme files: {e}")
-
-    def create_light_theme(self, path):
-        """Create light theme stylesheet"""
-        light_qss = """
+LIGHT_QSS_BYTES = b"""
 /* Light Theme for DOI Citation Manager */
 
 /* Main Window */
@@ -133,56 +102,56 @@ QComboBox QAbstractItemView {
 }
 
 /* Tree Widget */
-QTreeWidget {
+QTreeView {
     background-color: #ffffff;
     border: 1px solid #ccc;
     alternate-background-color: #f8f8f8;
     outline: none;
 }
 
-QTreeWidget::item {
+QTreeView::item {
     padding: 4px;
     border: none;
 }
 
-QTreeWidget::item:selected {
+QTreeView::item:selected {
     background-color: #e3f2fd;
     color: #1976d2;
 }
 
-QTreeWidget::item:hover {
+QTreeView::item:hover {
     background-color: #f0f8ff;
 }
 
-QTreeWidget::branch:closed:has-children {
+QTreeView::branch:closed:has-children {
     image: none;
     border: none;
 }
 
-QTreeWidget::branch:open:has-children {
+QTreeView::branch:open:has-children {
     image: none;
     border: none;
 }
 
-/* List Widget */
-QListWidget {
+/* Paper List */
+QListView#paperList {
     background-color: #ffffff;
     border: 1px solid #ccc;
     alternate-background-color: #f8f8f8;
     outline: none;
 }
 
-QListWidget::item {
+QListView#paperList::item {
     padding: 8px;
     border-bottom: 1px solid #eee;
 }
 
-QListWidget::item:selected {
+QListView#paperList::item:selected {
     background-color: #e3f2fd;
     color: #1976d2;
 }
 
-QListWidget::item:hover {
+QListView#paperList::item:hover {
     background-color: #f0f8ff;
 }
 
@@ -337,16 +306,8 @@ QRadioButton::indicator:checked {
     border-color: #2196F3;
 }
 """
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(light_qss)
-            logger.info(f"Light theme created: {path}")
-        except Exception as e:
-            logger.error(f"Error creating light theme: {e}")
 
-    def create_dark_theme(self, path):
-        """Create dark theme stylesheet"""
-        dark_qss = """
+DARK_QSS_BYTES = b"""
 /* Dark Theme for DOI Citation Manager */
 
 /* Main Window */
@@ -437,7 +398,7 @@ QComboBox QAbstractItemView {
 }
 
 /* Tree Widget */
-QTreeWidget {
+QTreeView {
     background-color: #363636;
     border: 1px solid #555;
     alternate-background-color: #404040;
@@ -445,22 +406,22 @@ QTreeWidget {
     color: #ffffff;
 }
 
-QTreeWidget::item {
+QTreeView::item {
     padding: 4px;
     border: none;
 }
 
-QTreeWidget::item:selected {
+QTreeView::item:selected {
     background-color: #1e88e5;
     color: #ffffff;
 }
 
-QTreeWidget::item:hover {
+QTreeView::item:hover {
     background-color: #424242;
 }
 
-/* List Widget */
-QListWidget {
+/* Paper List */
+QListView#paperList {
     background-color: #363636;
     border: 1px solid #555;
     alternate-background-color: #404040;
@@ -468,17 +429,17 @@ QListWidget {
     color: #ffffff;
 }
 
-QListWidget::item {
+QListView#paperList::item {
     padding: 8px;
     border-bottom: 1px solid #444;
 }
 
-QListWidget::item:selected {
+QListView#paperList::item:selected {
     background-color: #1e88e5;
     color: #ffffff;
 }
 
-QListWidget::item:hover {
+QListView#paperList::item:hover {
     background-color: #424242;
 }
 
@@ -640,53 +601,127 @@ QRadioButton::indicator:checked {
     border-color: #64b5f6;
 }
 """
+
+
+QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+QSS_SPACE_RE = re.compile(r"\s+")
+QSS_PUNCT_SPACE_RE = re.compile(r" ?([{};,]) ?")
+
+
+def minify_qss(stylesheet):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    stylesheet = QSS_COMMENT_RE.sub("", stylesheet)
+    stylesheet = QSS_SPACE_RE.sub(" ", stylesheet)
+    stylesheet = QSS_PUNCT_SPACE_RE.sub(r"\1", stylesheet)
+    # 선택자에서 ':' 앞의 공백은 하위 선택자 의미가 있으므로 뒤쪽 공백만 제거
+    return stylesheet.replace(": ", ":").strip()
+
+
+@lru_cache(maxsize=None)
+def read_stylesheet(theme_path):
+    """Read and minify a theme stylesheet once per path"""
+    with open(theme_path, "r", encoding="utf-8") as f:
+        return minify_qss(f.read())
+
+
+@lru_cache(maxsize=None)
+def theme_file_size(theme_path):
+    """Size of a theme file in bytes, or None if it does not exist"""
+    try:
+        return theme_path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+# 테마 파일을 읽을 수 없을 때 쓰는 내장 스타일시트
+EMBEDDED_THEMES = {"light": LIGHT_QSS_BYTES, "dark": DARK_QSS_BYTES}
+
+
+@lru_cache(maxsize=None)
+def embedded_stylesheet(theme_name):
+    """Minified built-in stylesheet for a theme"""
+    return minify_qss(EMBEDDED_THEMES[theme_name].decode("utf-8"))
+
+
+class ThemeManager(QObject):
+    """Manager for application themes (배포용 개선)"""
+
+    def __init__(self):
+        super().__init__()
+        self.current_theme = "light"
+
+    def ensure_theme_files(self):
+        """테마 파일들이 존재하는지 확인하고 필요시 생성"""
+        try:
+            # 스타일 디렉토리 생성
+            styles_dir = RESOURCES_DIR / "styles"
+            styles_dir.mkdir(parents=True, exist_ok=True)
+
+            # 라이트 테마 파일 생성/확인
+            light_theme_path = styles_dir / "light_theme.qss"
+            if not light_theme_path.exists():
+                self.create_light_theme(light_theme_path)
+
+            # 다크 테마 파일 생성/확인
+            dark_theme_path = styles_dir / "dark_theme.qss"
+            if not dark_theme_path.exists():
+                self.create_dark_theme(dark_theme_path)
+
+            logger.info(f"Theme files ensured in: {styles_dir}")
+
+        except Exception as e:
+            logger.error(f"Error ensuring theme files: {e}")
+
+    def create_light_theme(self, path):
+        """Create light theme stylesheet"""
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(dark_qss)
+            path.write_bytes(LIGHT_QSS_BYTES)
+            theme_file_size.cache_clear()
+            logger.info(f"Light theme created: {path}")
+        except Exception as e:
+            logger.error(f"Error creating light theme: {e}")
+
+    def create_dark_theme(self, path):
+        """Create dark theme stylesheet"""
+        try:
+            path.write_bytes(DARK_QSS_BYTES)
+            theme_file_size.cache_clear()
             logger.info(f"Dark theme created: {path}")
         except Exception as e:
             logger.error(f"Error creating dark theme: {e}")
 
+    def load_theme_stylesheet(self, theme_name):
+        """Return the stylesheet for a known theme, falling back to the built-in one"""
+        theme_path = THEMES[theme_name]
+        try:
+            # 테마 파일은 처음 한 번만 읽고 이후에는 캐시된 문자열 사용
+            return read_stylesheet(theme_path)
+        except FileNotFoundError:
+            logger.warning(f"Theme file not found: {theme_path}")
+        except Exception as e:
+            logger.error(f"Error loading theme {theme_name}: {e}")
+            return embedded_stylesheet(theme_name)
+
+        # Try to create the theme file and read it once more
+        self.ensure_theme_files()
+        try:
+            return read_stylesheet(theme_path)
+        except Exception as e:
+            logger.error(f"Error loading theme {theme_name}: {e}")
+            return embedded_stylesheet(theme_name)
+
     def apply_theme(self, app_or_widget, theme_name):
         """Apply theme to application or widget"""
-        self.current_theme = theme_name
-
-        if theme_name in THEMES:
-            theme_path = THEMES[theme_name]
-
-            if theme_path.exists():
-                try:
-                    with open(theme_path, "r", encoding="utf-8") as f:
-                        stylesheet = f.read()
-
-                    if hasattr(app_or_widget, "setStyleSheet"):
-                        app_or_widget.setStyleSheet(stylesheet)
-                    else:
-                        # Assume it's QApplication
-                        app_or_widget.setStyleSheet(stylesheet)
-
-                    logger.info(f"Applied theme: {theme_name}")
-
-                except Exception as e:
-                    logger.error(f"Error loading theme {theme_name}: {e}")
-                    self.apply_default_theme(app_or_widget)
-            else:
-                logger.warning(f"Theme file not found: {theme_path}")
-                # Try to create the theme file
-                self.ensure_theme_files()
-                # Retry once
-                if theme_path.exists():
-                    self.apply_theme(app_or_widget, theme_name)
-                else:
-                    self.apply_default_theme(app_or_widget)
-        else:
+        if theme_name not in THEMES:
             logger.warning(f"Unknown theme: {theme_name}")
-            self.apply_default_theme(app_or_widget)
+            theme_name = "light"
+
+        self.current_theme = theme_name
+        app_or_widget.setStyleSheet(self.load_theme_stylesheet(theme_name))
+        logger.info(f"Applied theme: {theme_name}")
 
     def apply_default_theme(self, app_or_widget):
         """Apply default (light) theme"""
-        # Ensure theme files exist
-        self.ensure_theme_files()
         self.apply_theme(app_or_widget, "light")
 
     def get_available_themes(self):
@@ -709,16 +744,17 @@ QRadioButton::indicator:checked {
     def theme_exists(self, theme_name):
         """Check if theme file exists"""
         if theme_name in THEMES:
-            return THEMES[theme_name].exists()
+            return theme_file_size(THEMES[theme_name]) is not None
         return False
 
     def get_theme_info(self):
         """Get information about available themes"""
         theme_info = {}
         for theme_name, theme_path in THEMES.items():
+            size = theme_file_size(theme_path)
             theme_info[theme_name] = {
                 "path": str(theme_path),
-                "exists": theme_path.exists(),
-                "size": theme_path.stat().st_size if theme_path.exists() else 0,
+                "exists": size is not None,
+                "size": size or 0,
             }
         return theme_info
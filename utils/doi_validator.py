@@ -6,167 +6,290 @@ DOI Validator for DOI Citation Manager
 """
 
 import re
-import requests
-from urllib.parse import urlparse, unquote
-from config import DOI_PATTERN, DOI_API_BASE, REQUEST_TIMEOUT
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit, unquote
+from config import (
+    DOI_API_BASE,
+    NETWORK_SETTINGS,
+    REQUEST_TIMEOUT,
+    USER_AGENT,
+)
+
+# 정리된 DOI 전체가 DOI여야 함 (공백 뒤에 다른 글자가 붙으면 무효)
+# 옛 SICI DOI에는 ; < > 가 들어가므로 공백만 막음
+# 숫자는 ASCII만, 공백은 NBSP도 막도록 유니코드 기준
+DOI_FORMAT_RE = re.compile(r"10\.[0-9]{4,}/\S+")
+
+# 제거할 DOI 접두사 (doi.org URL, doi: / doi= / "doi ")
+DOI_PREFIX_RE = re.compile(
+    r"^(?:(?:https?://)?(?:www\.|dx\.)?doi\.org/|doi[:= ])", re.IGNORECASE
+)
+
+# URL 매개변수(? 이후), 앵커(# 이후)와 그 앞의 후행 슬래시
+DOI_TAIL_RE = re.compile(r"/*(?:[?#].*)?\Z", re.DOTALL)
+
+# 텍스트 안의 DOI (일반 텍스트, URL, HTML 속성 값 모두 한 번에 검색)
+# 따옴표에서 끊고, URL 매개변수와 후행 슬래시는 clean_doi에서 제거
+DOI_TEXT_RE = re.compile(r'10\.[0-9]{4,}/[^\s\]>,;"\']+')
+
+# URL 스킴 (호스트를 읽을 때와 알 수 없는 주소에서 떼어낼 때 사용)
+URL_SCHEME_RE = re.compile(r"^https?://", re.IGNORECASE)
+
+# DOI 관련 도메인들 (하나의 정규식으로 한 번에 검색)
+DOI_DOMAINS = (
+    "doi.org",
+    "dx.doi.org",
+    "nature.com",
+    "sciencemag.org",
+    "cell.com",
+    "pnas.org",
+    "science.org",
+    "springer.com",
+    "wiley.com",
+    "elsevier.com",
+    "ieee.org",
+    "acm.org",
+    "sci-hub",
+)
+DOI_DOMAIN_RE = re.compile("|".join(map(re.escape, DOI_DOMAINS)), re.IGNORECASE)
+
+# 온라인 확인 결과 캐시: 정리된 DOI -> (접근 가능 여부, 만료 시각)
+# 실패 결과는 일시적인 오류일 수 있어 짧게만 보관
+ACCESSIBILITY_CACHE_SIZE = 2048
+ACCESSIBLE_TTL = 3600  # seconds
+INACCESSIBLE_TTL = 60  # seconds
+_accessibility_cache = {}
+_accessibility_cache_lock = threading.Lock()
+
+# Common mistakes and corrections
+# (패턴, 치환, 적용 조건) - 조건이 맞지 않는 입력에는 정규식을 돌리지 않음
+DOI_CORRECTIONS = (
+    # Missing prefix
+    (
+        re.compile(r"^(\d+\.\d+/.+)$"),
+        r"10.\1",
+        lambda doi: doi[:1].isdigit() and "/" in doi,
+    ),
+    # Wrong separators
+    (
+        re.compile(r"10[._](\d+)[._](.+)"),
+        r"10.\1/\2",
+        lambda doi: "_" in doi or doi.count(".") >= 2,
+    ),
+    # Extra spaces
+    (
+        re.compile(r"10\.\s*(\d+)\s*/\s*(.+)"),
+        r"10.\1/\2",
+        lambda doi: len(doi.split()) > 1,
+    ),
+    # Wrong case
+    (
+        re.compile(r"(?i)^doi:?\s*(.+)"),
+        r"\1",
+        lambda doi: doi[:3].lower() == "doi",
+    ),
+    # URL fragments
+    (
+        re.compile(r".*/10\.(\d+/.+)"),
+        r"10.\1",
+        lambda doi: "/10." in doi,
+    ),
+)
+
+
+def doi_from_doi_org_path(path):
+    """https://doi.org/10.1038/nature12373 -> 10.1038/nature12373"""
+    return path.lstrip("/")
+
+
+def doi_from_nature_path(path):
+    """https://www.nature.com/articles/nature12373 -> 10.1038/nature12373"""
+    section, _, article = path.lstrip("/").partition("/")
+    if section == "articles" and article:
+        return f"10.1038/{article.partition('/')[0]}"
+    return None
+
+
+def doi_from_sciencemag_path(path):
+    """.../content/early/2021/12/16/science.abm7892 -> 10.1126/science.abm7892"""
+    last_segment = path.rstrip("/").rpartition("/")[2]
+    if path.startswith("/content/") and last_segment.startswith("science."):
+        return f"10.1126/{last_segment}"
+    return None
+
+
+def doi_from_pnas_path(path):
+    """https://www.pnas.org/content/118/52/e2117553118 -> 10.1073/pnas.2117553118"""
+    # e2117553118.full 처럼 확장자가 붙은 경우도 있음
+    article = path.rstrip("/").rpartition("/")[2].partition(".")[0]
+    if path.startswith("/content/") and article[:1] == "e" and article[1:].isdigit():
+        return f"10.1073/pnas.{article[1:]}"
+    return None
+
+
+# 호스트(마지막 두 단계 도메인)별 DOI 추출
+# cell.com은 URL에서 DOI를 알 수 없어 일반 처리로 넘김
+PUBLISHER_DOI_HANDLERS = {
+    "doi.org": doi_from_doi_org_path,
+    "nature.com": doi_from_nature_path,
+    "sciencemag.org": doi_from_sciencemag_path,
+    "pnas.org": doi_from_pnas_path,
+}
+
+
+# 같은 DOI를 여러 번 정리/검사하는 경우가 많아 결과를 캐시
+@lru_cache(maxsize=4096)
+def clean_doi(doi):
+    """Clean DOI string by removing common prefixes"""
+    if not doi:
+        return ""
+
+    doi = doi.strip()
+
+    # 접두사 제거
+    doi = DOI_PREFIX_RE.sub("", doi, count=1)
+
+    # URL 매개변수, 앵커, 후행 슬래시를 한 번에 제거
+    return DOI_TAIL_RE.sub("", doi, count=1).strip()
+
+
+def is_valid_cleaned_doi(doi):
+    """Check the format of a DOI that has already been cleaned"""
+    # 대부분의 무효 입력은 앞부분만 보고 정규식 없이 거름 (최소 "10.dddd/x")
+    if not doi or len(doi) < 9 or not doi.startswith("10.") or not "0" <= doi[3] <= "9":
+        return False
+    return DOI_FORMAT_RE.fullmatch(doi) is not None
+
+
+@lru_cache(maxsize=4096)
+def is_valid_doi_format(doi):
+    """Check if DOI has valid format"""
+    if not doi:
+        return False
+
+    return is_valid_cleaned_doi(clean_doi(doi))
+
+
+def extract_doi_from_url(url):
+    """URL에서 DOI 추출 (새로운 기능)"""
+    if not url:
+        return None
 
+    # URL 디코딩
+    url = unquote(url).strip()
+
+    # 스킴이 없는 입력(www.nature.com/...)도 호스트를 읽을 수 있게 함
+    try:
+        parts = urlsplit(url if URL_SCHEME_RE.match(url) else f"//{url}")
+        host = (parts.hostname or "").lower()
+    except ValueError:  # 잘못된 IPv6 주소 등
+        parts, host = None, ""
+    if host.startswith("www."):
+        host = host[4:]
+
+    if not host:
+        handler = None
+    elif host.startswith("sci-hub."):
+        # sci-hub 주소 뒤에 붙은 DOI 또는 DOI URL
+        handler = doi_from_doi_org_path
+    else:
+        handler = PUBLISHER_DOI_HANDLERS.get(".".join(host.split(".")[-2:]))
+
+    if handler is not None:
+        potential_doi = handler(parts.path)
+        if potential_doi:
+            cleaned_doi = clean_doi(potential_doi)
+            if is_valid_cleaned_doi(cleaned_doi):
+                return cleaned_doi
+
+    # 그 밖의 입력은 스킴만 떼고 DOI인지 확인
+    cleaned_doi = clean_doi(URL_SCHEME_RE.sub("", url, count=1))
+    if is_valid_cleaned_doi(cleaned_doi):
+        return cleaned_doi
 
-class DOIValidator:
-    """Validator for DOI format and accessibility"""
+    return None
 
-    def __init__(self):
-        self.doi_pattern = re.compile(DOI_PATTERN)
-
-        # 확장된 DOI 패턴들
-        self.doi_patterns = [
-            # 기본 DOI 패턴
-            r"10\.\d{4,}/[^\s\]>,;]+",
-            # URL 내 DOI 패턴
-            r"(?:doi\.org/|dx\.doi\.org/)?(10\.\d{4,}/[^\s\]>,;/?]+)",
-            # HTML 내 DOI 패턴
-            r'doi[:\s]*["\']?(10\.\d{4,}/[^\s\]>,;"\']+)["\']?',
-        ]
 
-    def extract_doi_from_input(self, input_text):
-        """
-        다양한 입력 형식에서 DOI 추출 (새로운 기능)
-        지원 형식:
-        - 순수 DOI: 10.1038/nature12373
-        - DOI URL: https://doi.org/10.1038/nature12373
-        - 논문 URL: https://www.nature.com/articles/nature12373
-        - DOI 접두사: doi:10.1038/nature12373
-        - sci-hub 스타일: sci-hub.tw/10.1038/nature12373
-        """
-        if not input_text:
-            return None
+def extract_dois_from_text(text):
+    """Extract all DOIs from a text string"""
+    if not text:
+        return []
+
+    # 한 번 훑어서 후보를 찾고, 같은 문자열은 한 번만 검사
+    candidates = dict.fromkeys(match.group(0) for match in DOI_TEXT_RE.finditer(text))
+    cleaned_dois = (clean_doi(doi) for doi in candidates)
 
-        input_text = input_text.strip()
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(doi for doi in cleaned_dois if is_valid_cleaned_doi(doi)))
 
-        # 1. 기본 DOI 형식 확인
-        basic_doi = self.clean_doi(input_text)
-        if self.is_valid_doi_format(basic_doi):
-            return basic_doi
 
-        # 2. URL에서 DOI 추출 시도
-        doi_from_url = self.extract_doi_from_url(input_text)
-        if doi_from_url:
-            return doi_from_url
+# 같은 입력(같은 URL을 여러 번 붙여넣기, 다시 검사)은 결과를 재사용
+@lru_cache(maxsize=1024)
+def extract_doi_from_input(input_text):
+    """
+    다양한 입력 형식에서 DOI 추출 (새로운 기능)
+    지원 형식:
+    - 순수 DOI: 10.1038/nature12373
+    - DOI URL: https://doi.org/10.1038/nature12373
+    - 논문 URL: https://www.nature.com/articles/nature12373
+    - DOI 접두사: doi:10.1038/nature12373
+    - sci-hub 스타일: sci-hub.tw/10.1038/nature12373
+    """
+    if not input_text:
+        return None
 
-        # 3. 텍스트에서 DOI 패턴 검색
-        extracted_dois = self.extract_dois_from_text(input_text)
-        if extracted_dois:
-            return extracted_dois[0]  # 첫 번째 발견된 DOI 반환
+    input_text = input_text.strip()
 
+    # 1. 기본 DOI 형식 확인
+    basic_doi = clean_doi(input_text)
+    if is_valid_cleaned_doi(basic_doi):
+        return basic_doi
+    # DOI로 시작하지만 공백 뒤에 글자가 더 있으면 앞부분만 잘라서 반환하지 않음
+    if DOI_FORMAT_RE.match(basic_doi):
         return None
 
-    def extract_doi_from_url(self, url):
-        """URL에서 DOI 추출 (새로운 기능)"""
-        if not url:
-            return None
+    # 2. URL에서 DOI 추출 시도
+    doi_from_url = extract_doi_from_url(input_text)
+    if doi_from_url:
+        return doi_from_url
 
-        # URL 디코딩
-        url = unquote(url)
-
-        # 일반적인 DOI URL 패턴들
-        doi_url_patterns = [
-            # https://doi.org/10.1038/nature12373
-            r"(?:https?://)?(?:dx\.)?doi\.org/(.+)",
-            # https://www.nature.com/articles/nature12373 -> 10.1038/nature12373
-            r"(?:https?://)?www\.nature\.com/articles/([^/?]+)",
-            # https://science.sciencemag.org/content/early/2021/12/16/science.abm7892
-            r"(?:https?://)?science\.sciencemag\.org/content/[^/]+/[^/]+/[^/]+/science\.([^/?]+)",
-            # https://www.cell.com/cell/fulltext/S0092-8674(21)01496-3
-            r"(?:https?://)?www\.cell\.com/[^/]+/fulltext/S\d+-\d+\(\d+\)\d+-\d+",
-            # https://www.pnas.org/content/118/52/e2117553118
-            r"(?:https?://)?www\.pnas\.org/content/\d+/\d+/e(\d+)",
-            # sci-hub URLs
-            r"(?:https?://)?(?:sci-hub\.[^/]+/)?(.+)",
-        ]
-
-        for pattern in doi_url_patterns:
-            match = re.search(pattern, url, re.IGNORECASE)
-            if match:
-                potential_doi = match.group(1)
-
-                # Nature 특별 처리
-                if "nature.com" in url and potential_doi:
-                    potential_doi = f"10.1038/{potential_doi}"
-
-                # Science 특별 처리
-                elif "sciencemag.org" in url and potential_doi:
-                    potential_doi = f"10.1126/science.{potential_doi}"
-
-                # PNAS 특별 처리
-                elif "pnas.org" in url and potential_doi:
-                    potential_doi = f"10.1073/pnas.{potential_doi}"
-
-                # Cell 특별 처리 (복잡한 URL 구조)
-                elif "cell.com" in url:
-                    # Cell URL에서 DOI 추출은 더 복잡하므로 기본 검색으로 넘김
-                    continue
-
-                # 추출된 DOI 검증
-                cleaned_doi = self.clean_doi(potential_doi)
-                if self.is_valid_doi_format(cleaned_doi):
-                    return cleaned_doi
+    # 3. 텍스트에서 DOI 패턴 검색
+    extracted_dois = extract_dois_from_text(input_text)
+    if extracted_dois:
+        return extracted_dois[0]  # 첫 번째 발견된 DOI 반환
 
-        return None
+    return None
+
+
+class DOIValidator:
+    """Validator for DOI format and accessibility"""
+
+    def __init__(self):
+        self.session = None  # 온라인 확인을 처음 할 때 생성
+        self.session_lock = threading.Lock()
+
+    def extract_doi_from_input(self, input_text):
+        """다양한 입력 형식(DOI, DOI URL, 논문 URL, sci-hub 등)에서 DOI 추출"""
+        return extract_doi_from_input(input_text)
+
+    def extract_doi_from_url(self, url):
+        """URL에서 DOI 추출 (새로운 기능)"""
+        return extract_doi_from_url(url)
 
     def clean_doi(self, doi):
         """Clean DOI string by removing common prefixes"""
-        if not doi:
-            return ""
-
-        doi = doi.strip()
-
-        # 확장된 접두사 목록
-        prefixes = [
-            "https://doi.org/",
-            "http://doi.org/",
-            "https://dx.doi.org/",
-            "http://dx.doi.org/",
-            "https://www.doi.org/",
-            "http://www.doi.org/",
-            "doi.org/",
-            "dx.doi.org/",
-            "www.doi.org/",
-            "doi:",
-            "DOI:",
-            "doi ",
-            "DOI ",
-            "doi=",
-            "DOI=",
-        ]
-
-        # 접두사 제거
-        for prefix in prefixes:
-            if doi.lower().startswith(prefix.lower()):
-                doi = doi[len(prefix) :]
-                break
-
-        # URL 매개변수 제거 (? 이후)
-        if "?" in doi:
-            doi = doi.split("?")[0]
-
-        # 앵커 제거 (# 이후)
-        if "#" in doi:
-            doi = doi.split("#")[0]
-
-        # 후행 슬래시 제거
-        doi = doi.rstrip("/")
-
-        return doi.strip()
+        return clean_doi(doi)
 
     def is_valid_doi_format(self, doi):
         """Check if DOI has valid format"""
-        if not doi:
-            return False
+        return is_valid_doi_format(doi)
 
-        # Clean the DOI
-        cleaned_doi = self.clean_doi(doi)
-
-        # Check format with regex
-        return bool(self.doi_pattern.match(cleaned_doi))
+    def is_valid_cleaned_doi(self, doi):
+        """Check the format of a DOI that has already been cleaned"""
+        return is_valid_cleaned_doi(doi)
 
     def is_valid_doi(self, doi):
         """Check if DOI is valid (format + accessible)"""
@@ -179,14 +302,61 @@ class DOIValidator:
         # In production, you might want to make this configurable
         return True
 
+    def get_session(self):
+        """Return the shared HTTP session used for accessibility checks"""
+        with self.session_lock:
+            if self.session is None:
+                # 온라인 확인에만 필요하므로 사용할 때 불러옴
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.headers.update({"User-Agent": USER_AGENT})
+
+                # 여러 DOI를 동시에 확인할 때 연결(TLS 포함)을 재사용
+                adapter = HTTPAdapter(pool_maxsize=NETWORK_SETTINGS["max_connections"])
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self.session = session
+            return self.session
+
     def check_doi_accessibility(self, doi):
-        """Check if DOI is accessible online"""
+        """Check if DOI is accessible online (results cached for a while)"""
+        return self.check_cleaned_doi_accessibility(self.clean_doi(doi))
+
+    def check_cleaned_doi_accessibility(self, cleaned_doi):
+        """Check if an already cleaned DOI is accessible online"""
+        now = time.monotonic()
+
+        with _accessibility_cache_lock:
+            cached = _accessibility_cache.get(cleaned_doi)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+
+        accessible = self.request_doi_accessibility(cleaned_doi)
+
+        ttl = ACCESSIBLE_TTL if accessible else INACCESSIBLE_TTL
+        with _accessibility_cache_lock:
+            _accessibility_cache.pop(cleaned_doi, None)
+            if len(_accessibility_cache) >= ACCESSIBILITY_CACHE_SIZE:
+                # 가장 오래전에 넣은 항목부터 제거
+                del _accessibility_cache[next(iter(_accessibility_cache))]
+            _accessibility_cache[cleaned_doi] = (accessible, now + ttl)
+
+        return accessible
+
+    def request_doi_accessibility(self, cleaned_doi):
+        """Send a HEAD request to check if a cleaned DOI resolves"""
+        # 온라인 확인에만 필요하므로 사용할 때 불러옴
+        import requests
+
         try:
-            cleaned_doi = self.clean_doi(doi)
             url = f"{DOI_API_BASE}{cleaned_doi}"
 
             # Make a HEAD request to check accessibility without downloading content
-            response = requests.head(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+            response = self.get_session().head(
+                url, timeout=REQUEST_TIMEOUT, allow_redirects=True
+            )
 
             # Consider it accessible if we get a valid HTTP response
             return 200 <= response.status_code < 400
@@ -194,52 +364,38 @@ class DOIValidator:
         except requests.RequestException:
             return False
 
-    def validate_doi_batch(self, doi_list):
-        """Validate a list of DOIs"""
+    def validate_doi_batch(self, doi_list, check_access=False):
+        """Validate a list of DOIs, optionally checking accessibility"""
         results = []
 
         for doi in doi_list:
+            cleaned_doi = self.clean_doi(doi)
             result = {
                 "doi": doi,
-                "cleaned_doi": self.clean_doi(doi),
-                "valid_format": self.is_valid_doi_format(doi),
+                "cleaned_doi": cleaned_doi,
+                "valid_format": self.is_valid_cleaned_doi(cleaned_doi),
                 "accessible": None,  # Will be filled if checked
             }
             results.append(result)
 
+        if check_access:
+            to_check = [result for result in results if result["valid_format"]]
+            if to_check:
+                # 요청은 서로 독립적이므로 동시에 보냄 (연결 수는 설정값으로 제한)
+                max_workers = min(NETWORK_SETTINGS["max_connections"], len(to_check))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    accessible = executor.map(
+                        self.check_cleaned_doi_accessibility,
+                        [result["cleaned_doi"] for result in to_check],
+                    )
+                    for result, is_accessible in zip(to_check, accessible):
+                        result["accessible"] = is_accessible
+
         return results
 
     def extract_dois_from_text(self, text):
         """Extract all DOIs from a text string"""
-        if not text:
-            return []
-
-        # Find all DOI patterns in text
-        dois = []
-
-        # 확장된 패턴들로 검색
-        for pattern in self.doi_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # 매치된 그룹에서 DOI 추출
-                if match.groups():
-                    doi = match.group(1) if len(match.groups()) > 0 else match.group(0)
-                else:
-                    doi = match.group(0)
-
-                cleaned_doi = self.clean_doi(doi)
-                if cleaned_doi and self.is_valid_doi_format(cleaned_doi):
-                    dois.append(cleaned_doi)
-
-        # Remove duplicates while preserving order
-        unique_dois = []
-        seen = set()
-        for doi in dois:
-            if doi not in seen:
-                unique_dois.append(doi)
-                seen.add(doi)
-
-        return unique_dois
+        return extract_dois_from_text(text)
 
     def suggest_doi_corrections(self, invalid_doi):
         """Suggest corrections for invalid DOI"""
@@ -250,60 +406,46 @@ class DOIValidator:
 
         original = invalid_doi.strip()
 
-        # Common mistakes and corrections
-        corrections = [
-            # Missing prefix
-            (r"^(\d+\.\d+/.+)$", r"10.\1"),
-            # Wrong separators
-            (r"10[._](\d+)[._](.+)", r"10.\1/\2"),
-            # Extra spaces
-            (r"10\.\s*(\d+)\s*/\s*(.+)", r"10.\1/\2"),
-            # Wrong case
-            (r"(?i)^doi:?\s*(.+)", r"\1"),
-            # URL fragments
-            (r".*/10\.(\d+/.+)", r"10.\1"),
-        ]
-
-        for pattern, replacement in corrections:
-            corrected = re.sub(pattern, replacement, original)
+        for pattern, replacement, applies in DOI_CORRECTIONS:
+            if not applies(original):
+                continue
+            corrected = pattern.sub(replacement, original)
             if corrected != original and self.is_valid_doi_format(corrected):
                 suggestions.append(corrected)
 
-        return suggestions
+        # 여러 규칙이 같은 결과를 내면 한 번만 제안
+        return list(dict.fromkeys(suggestions))
 
     def get_doi_parts(self, doi):
         """Parse DOI into its components"""
         cleaned_doi = self.clean_doi(doi)
 
-        if not self.is_valid_doi_format(cleaned_doi):
+        if not self.is_valid_cleaned_doi(cleaned_doi):
             return None
 
         # Split into prefix and suffix
-        parts = cleaned_doi.split("/", 1)
-        if len(parts) != 2:
+        prefix, sep, suffix = cleaned_doi.partition("/")
+        if not sep:
             return None
 
-        prefix = parts[0]
-        suffix = parts[1]
-
         # Further parse prefix
-        prefix_parts = prefix.split(".")
-        if len(prefix_parts) < 2:
+        directory_indicator, sep, registrant_code = prefix.partition(".")
+        if not sep:
             return None
 
         return {
             "full_doi": cleaned_doi,
             "prefix": prefix,
             "suffix": suffix,
-            "directory_indicator": prefix_parts[0],  # Usually '10'
-            "registrant_code": ".".join(prefix_parts[1:]),
+            "directory_indicator": directory_indicator,  # Usually '10'
+            "registrant_code": registrant_code,
         }
 
     def format_doi_for_display(self, doi):
         """Format DOI for consistent display"""
         cleaned_doi = self.clean_doi(doi)
 
-        if not self.is_valid_doi_format(cleaned_doi):
+        if not self.is_valid_cleaned_doi(cleaned_doi):
             return doi  # Return original if invalid
 
         return cleaned_doi
@@ -312,7 +454,7 @@ class DOIValidator:
         """Format DOI as clickable URL"""
         cleaned_doi = self.clean_doi(doi)
 
-        if not self.is_valid_doi_format(cleaned_doi):
+        if not self.is_valid_cleaned_doi(cleaned_doi):
             return None
 
         return f"{DOI_API_BASE}{cleaned_doi}"
@@ -334,7 +476,7 @@ class DOIValidator:
             return result
 
         # Check format
-        if not self.is_valid_doi_format(doi):
+        if not self.is_valid_cleaned_doi(result["cleaned_doi"]):
             result["errors"].append("Invalid DOI format")
             result["suggestions"] = self.suggest_doi_corrections(doi)
         else:
@@ -350,7 +492,7 @@ class DOIValidator:
         # Check accessibility (optional)
         if result["valid_format"]:
             try:
-                result["accessible"] = self.check_doi_accessibility(
+                result["accessible"] = self.check_cleaned_doi_accessibility(
                     result["cleaned_doi"]
                 )
                 if not result["accessible"]:
@@ -365,22 +507,4 @@ class DOIValidator:
         if not url:
             return False
 
-        # DOI 관련 도메인들
-        doi_domains = [
-            "doi.org",
-            "dx.doi.org",
-            "nature.com",
-            "sciencemag.org",
-            "cell.com",
-            "pnas.org",
-            "science.org",
-            "springer.com",
-            "wiley.com",
-            "elsevier.com",
-            "ieee.org",
-            "acm.org",
-            "sci-hub",
-        ]
-
-        url_lower = url.lower()
-        return any(domain in url_lower for domain in doi_domains)
+        return bool(DOI_DOMAIN_RE.search(url))